@@ -0,0 +1,216 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\xee\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><g fill=\x22none\x22\
+ stroke=\x22#cccccc\
+\x22 stroke-width=\x22\
+1\x22><rect x=\x221.5\x22\
+ y=\x222.5\x22 width=\x22\
+13\x22 height=\x2211\x22 \
+rx=\x221\x22/><path d=\
+\x22M1.5 5.5h13M8 5\
+.5v8M1.5 9.5h13\x22\
+/></g></svg>\x0a\
+\x00\x00\x00\xb4\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><rect x=\x223.5\x22 \
+y=\x223.5\x22 width=\x229\
+\x22 height=\x229\x22 fil\
+l=\x22none\x22 stroke=\
+\x22#cccccc\x22 stroke\
+-width=\x221\x22/></sv\
+g>\x0a\
+\x00\x00\x00\xd0\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><g fill=\x22none\x22\
+ stroke=\x22#cccccc\
+\x22 stroke-width=\x22\
+1.2\x22><path d=\x22M1\
+2.5 5.5a5 5 0 1 \
+0 0.5 4\x22/><path \
+d=\x22M13 2v3.5h-3.\
+5\x22/></g></svg>\x0a\
+\x00\x00\x00\xb4\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><path d=\x22M1.5 \
+3.5h5l1.5 1.5h6.\
+5v8h-13z\x22 fill=\x22\
+#dcb67a\x22 stroke=\
+\x22#c09553\x22 stroke\
+-width=\x221\x22/></sv\
+g>\x0a\
+\x00\x00\x00\xa4\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><path d=\x22M3.5 \
+3.5l9 9M12.5 3.5\
+l-9 9\x22 stroke=\x22#\
+cccccc\x22 stroke-w\
+idth=\x221.2\x22/></sv\
+g>\x0a\
+\x00\x00\x00\x82\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><path d=\x22M11 3\
+v10L4 8z\x22 fill=\x22\
+#cccccc\x22/></svg>\
+\x0a\
+\x00\x00\x00\x91\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><path d=\x22M3 8.\
+5h10\x22 stroke=\x22#c\
+ccccc\x22 stroke-wi\
+dth=\x221\x22/></svg>\x0a\
+\
+\x00\x00\x00\xd9\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><g fill=\x22none\x22\
+ stroke=\x22#cccccc\
+\x22 stroke-width=\x22\
+1\x22><rect x=\x223.5\x22\
+ y=\x225.5\x22 width=\x22\
+7\x22 height=\x227\x22/><\
+path d=\x22M5.5 5.5\
+v-2h7v7h-2\x22/></g\
+></svg>\x0a\
+\x00\x00\x01\x0e\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2216\
+\x22 height=\x2216\x22 vi\
+ewBox=\x220 0 16 16\
+\x22><path d=\x22M1.5 \
+3.5h5l1.5 1.5h5v\
+2\x22 fill=\x22none\x22 s\
+troke=\x22#c09553\x22 \
+stroke-width=\x221\x22\
+/><path d=\x22M1.5 \
+13.5v-10M1.5 13.\
+5l2.5-6h11l-2.5 \
+6z\x22 fill=\x22#dcb67\
+a\x22 stroke=\x22#c095\
+53\x22 stroke-width\
+=\x221\x22/></svg>\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0a\
+\x0bi\x9aG\
+\x00w\
+\x00i\x00n\x00d\x00o\x00w\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x0fy\xbaG\
+\x00m\
+\x00a\x00x\x00i\x00m\x00i\x00z\x00e\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x0cj!\xc7\
+\x00r\
+\x00e\x00f\x00r\x00e\x00s\x00h\x00.\x00s\x00v\x00g\
+\x00\x0a\
+\x0a\xc8\xf6\x87\
+\x00f\
+\x00o\x00l\x00d\x00e\x00r\x00.\x00s\x00v\x00g\
+\x00\x09\
+\x06\x98\x8e\xa7\
+\x00c\
+\x00l\x00o\x00s\x00e\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x0a\xdc?\xc7\
+\x00c\
+\x00o\x00l\x00l\x00a\x00p\x00s\x00e\x00.\x00s\x00v\x00g\
+\x00\x0c\
+\x0f\x88\xfaG\
+\x00m\
+\x00i\x00n\x00i\x00m\x00i\x00z\x00e\x00.\x00s\x00v\x00g\
+\x00\x0b\
+\x06y\xcf\xa7\
+\x00r\
+\x00e\x00s\x00t\x00o\x00r\x00e\x00.\x00s\x00v\x00g\
+\x00\x0f\
+\x02O/'\
+\x00o\
+\x00p\x00e\x00n\x00_\x00f\x00o\x00l\x00d\x00e\x00r\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\x05\xd6\
+\x00\x00\x01\xa1A\xd4\xb1e\
+\x00\x00\x00\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x04\xf9\
+\x00\x00\x01\xa1A\xd4\xb1^\
+\x00\x00\x00~\x00\x00\x00\x00\x00\x01\x00\x00\x036\
+\x00\x00\x01\xa1A\xd4\xb1a\
+\x00\x00\x00d\x00\x00\x00\x00\x00\x01\x00\x00\x02~\
+\x00\x00\x01\xa1A\xd4\xb1d\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x03\xde\
+\x00\x00\x01\xa1A\xd4\xb1g\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1A\xd4\xb1c\
+\x00\x00\x00H\x00\x00\x00\x00\x00\x01\x00\x00\x01\xaa\
+\x00\x00\x01\xa1A\xd4\xb1f\
+\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x00\xf2\
+\x00\x00\x01\xa1A\xd4\xb1[\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x04d\
+\x00\x00\x01\xa1A\xd4\xb1W\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,105 @@
+"""I/O helpers shared by the ViewMesh apps: the background writer for QSettings values and
+config files, and directory warming for the file explorers."""
+import atexit
+import logging
+import os
+import queue
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from PySide6.QtCore import QSettings, QThread
+
+log = logging.getLogger(__name__)
+
+def _write_atomic(path: Path, blob: bytes) -> None:
+    """Write the blob to a temporary sibling then rename it over the target in one step."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(blob)
+    os.replace(tmp_path, path)
+
+def warm_directory(path: str) -> None:
+    """Read a directory's entries so the OS has the listing cached before an explorer model reads it."""
+    try:
+        with os.scandir(path) as entries:
+            for _ in entries:
+                pass
+    except OSError:
+        pass
+
+class _SaveWorker(QThread):
+    """Applies queued settings values and file blobs on a background thread.
+
+    Each queued item is (store, key, value): store is an (org_name, app_name) pair for
+    a QSettings value, or a Path with key None for a whole-file blob. Settings values
+    are applied in order and each store touched is synced once per batch; of a batch
+    of blobs only the newest per file is written.
+    """
+    def __init__(self):
+        super().__init__()
+        self.writes: queue.Queue = queue.Queue() # (store, key, value) items, None to stop
+
+    def run(self):
+        # QSettings is reentrant, so this thread opens its own instance of each store
+        stores: Dict[Tuple[str, str], QSettings] = {}
+        while True:
+            batch = [self.writes.get()]
+            while True:
+                try:
+                    batch.append(self.writes.get_nowait())
+                except queue.Empty:
+                    break
+            blobs: Dict[Path, bytes] = {}
+            touched: Set[Tuple[str, str]] = set()
+            for item in batch:
+                if item is None:
+                    continue
+                store, key, value = item
+                if isinstance(store, Path):
+                    blobs[store] = value
+                    continue
+                settings = stores.get(store)
+                if settings is None:
+                    settings = stores[store] = QSettings(*store)
+                settings.setValue(key, value)
+                touched.add(store)
+            for path, blob in blobs.items():
+                try:
+                    _write_atomic(path, blob)
+                except OSError as e:
+                    log.error("Error writing configuration: %s", e)
+            for store in touched:
+                stores[store].sync()
+            if any(item is None for item in batch):
+                return
+
+_save_worker: Optional[_SaveWorker] = None
+
+def _get_save_worker() -> _SaveWorker:
+    global _save_worker
+    if _save_worker is None:
+        _save_worker = _SaveWorker()
+        _save_worker.start()
+    return _save_worker
+
+class SettingsWriter:
+    """Write-only stand-in for QSettings whose setValue() queues the write for the writer thread."""
+    def __init__(self, org_name: str, app_name: str):
+        self.store = (org_name, app_name)
+
+    def setValue(self, key: str, value: Any) -> None:
+        _get_save_worker().writes.put((self.store, key, value))
+
+def queue_file_write(path: Path, blob: bytes) -> None:
+    """Queue a whole-file blob to be written atomically to path by the writer thread."""
+    _get_save_worker().writes.put((path, None, blob))
+
+def flush_settings_writes() -> None:
+    """Drain any queued writes to disk and stop the writer thread."""
+    global _save_worker
+    worker, _save_worker = _save_worker, None
+    if worker is not None:
+        worker.writes.put(None)
+        worker.wait()
+
+atexit.register(flush_settings_writes)
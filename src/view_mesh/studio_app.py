@@ -1,8 +1,12 @@
 import argparse
 import asyncio
+import contextlib
+import functools
 import json
+import logging
 import os
 import sys
+import threading
 import ctypes
 from ctypes import wintypes
 from dataclasses import dataclass, field
@@ -16,21 +20,60 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QPushButton, QFrame, QTextEdit, QScrollArea, QFileDialog
 )
 from PySide6.QtCore import (
-    Qt, QDir, QModelIndex, QSize, QPoint, QSettings, 
-    QEvent, QFile, QStandardPaths, Signal, QTimer, QRect, QObject
+    Qt, QDir, QModelIndex, QSize, QPoint, QSettings, QByteArray,
+    QEvent, QFile, QStandardPaths, Signal, QTimer, QRect, QObject, QThreadPool
 )
 from PySide6.QtGui import (
     QIcon, QAction, QKeySequence, QCloseEvent, QFont, 
     QMouseEvent, QColor, QPalette, QResizeEvent, QPainter, QCursor, QFontMetrics, 
-    QPen, QPaintEvent, QPixmap
+    QPen, QPaintEvent, QPixmap, QTextCursor
 )
 from abc import ABC, abstractmethod
 
+import qasync  # Imported after PySide6 so qasync binds to it
+
+from view_mesh import resources_rc  # noqa: F401  Registers the compiled :/icons resources
+from view_mesh.settings_io import SettingsWriter, flush_settings_writes, warm_directory
+
 # Define an Enum for handle positions
 import enum
 
 DEBUG_LOGS=False
 
+# Hot-path diagnostics go through logging so they cost nothing below the active level
+log = logging.getLogger(__name__)
+
+# Process-lifetime invariants, looked up once
+_HOME_DIR = str(Path.home())
+
+@functools.cache
+def _app_font() -> QFont:
+    """The application font as first seen by a window, read once per process."""
+    return QFont(QApplication.font())
+
+# Shared partial fonts: only the properties set here are overridden, the rest (family,
+# size) still inherit from the parent, so they keep following global font size changes.
+@functools.cache
+def _bold_font() -> QFont:
+    font = QFont()
+    font.setBold(True)
+    return font
+
+@functools.cache
+def _small_font() -> QFont:
+    font = QFont()
+    font.setPointSize(9)
+    return font
+
+@functools.cache
+def _icon(name: str) -> QIcon:
+    """An icon from the compiled resources (see resources.qrc), loaded once per name.
+
+    Window chrome uses these rather than emoji/symbol text, which would send Qt
+    through font fallback lookups for every glyph on first paint.
+    """
+    return QIcon(f":/icons/{name}.svg")
+
 class WindowGeometryManager:
     """Manages saving and restoring window geometry, handling multi-screen setups."""
     def __init__(self, window: QMainWindow, settings_object: Any, main_app_window_ref: Optional[QMainWindow] = None):
@@ -70,10 +113,10 @@ class WindowGeometryManager:
                 target_screen = QApplication.primaryScreen()
 
         if not target_screen: # Should be extremely rare
-            print(f"WindowGeometryManager ({self.window.windowTitle()}): Critical - No target screen found. Using primary screen.")
+            log.warning("WindowGeometryManager (%s): Critical - No target screen found. Using primary screen.", self.window.windowTitle())
             target_screen = QApplication.primaryScreen()
             if not target_screen: # Even rarer, e.g. no screens connected
-                 print(f"WindowGeometryManager ({self.window.windowTitle()}): Critical - No primary screen available.")
+                 log.warning("WindowGeometryManager (%s): Critical - No primary screen available.", self.window.windowTitle())
                  self.window.move(self.settings.position[0], self.settings.position[1]) # Basic move
                  return
 
@@ -164,6 +207,48 @@ class HandlePosition(enum.Enum):
     BOTTOM = 6
     BOTTOM_RIGHT = 7
 
+class ResizeDir(enum.IntFlag):
+    """Window edges grabbed for a resize; the bits index _EDGE_TABLE."""
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    TOP = 4
+    BOTTOM = 8
+
+# Fallback (Python-driven) window drags and resizes apply the latest geometry at most this often
+_DRAG_UPDATE_INTERVAL_MS = 16 # Roughly 60 FPS
+
+# Qt edges for every 4-bit ResizeDir code, so a press maps to startSystemResize by one lookup
+_EDGE_TABLE = [
+    (Qt.Edge.LeftEdge if code & ResizeDir.LEFT else Qt.Edge(0))
+    | (Qt.Edge.RightEdge if code & ResizeDir.RIGHT else Qt.Edge(0))
+    | (Qt.Edge.TopEdge if code & ResizeDir.TOP else Qt.Edge(0))
+    | (Qt.Edge.BottomEdge if code & ResizeDir.BOTTOM else Qt.Edge(0))
+    for code in range(16)
+]
+
+_HANDLE_RESIZE_DIRS = {
+    HandlePosition.TOP_LEFT: ResizeDir.TOP | ResizeDir.LEFT,
+    HandlePosition.TOP: ResizeDir.TOP,
+    HandlePosition.TOP_RIGHT: ResizeDir.TOP | ResizeDir.RIGHT,
+    HandlePosition.LEFT: ResizeDir.LEFT,
+    HandlePosition.RIGHT: ResizeDir.RIGHT,
+    HandlePosition.BOTTOM_LEFT: ResizeDir.BOTTOM | ResizeDir.LEFT,
+    HandlePosition.BOTTOM: ResizeDir.BOTTOM,
+    HandlePosition.BOTTOM_RIGHT: ResizeDir.BOTTOM | ResizeDir.RIGHT,
+}
+
+_HANDLE_CURSORS = {
+    HandlePosition.TOP_LEFT: Qt.SizeFDiagCursor,
+    HandlePosition.BOTTOM_RIGHT: Qt.SizeFDiagCursor,
+    HandlePosition.TOP_RIGHT: Qt.SizeBDiagCursor,
+    HandlePosition.BOTTOM_LEFT: Qt.SizeBDiagCursor,
+    HandlePosition.TOP: Qt.SizeVerCursor,
+    HandlePosition.BOTTOM: Qt.SizeVerCursor,
+    HandlePosition.LEFT: Qt.SizeHorCursor,
+    HandlePosition.RIGHT: Qt.SizeHorCursor,
+}
+
 class EdgeResizeHandle(QWidget):
     def __init__(self, parent_window: QMainWindow, position: HandlePosition, thickness: int = 5):
         super().__init__(parent_window) # Parent is the main window
@@ -197,6 +282,11 @@ class EdgeResizeHandle(QWidget):
         self.is_dragging = False
         self.drag_start_pos = None
         self.parent_window_start_geometry = None
+        self._pending_geometry: Optional[QRect] = None
+        self._geometry_throttle = QTimer(self)
+        self._geometry_throttle.setSingleShot(True)
+        self._geometry_throttle.setInterval(_DRAG_UPDATE_INTERVAL_MS)
+        self._geometry_throttle.timeout.connect(self._apply_pending_geometry)
 
         self.update_geometry() # Call after setting palette, ensure it has a size before show
         # print(f"[DEBUG EdgeHandle Init] Pos: {self.position}, Initial Geometry: {self.geometry()}")
@@ -236,26 +326,26 @@ class EdgeResizeHandle(QWidget):
         self.raise_() # Ensure it's on top
 
     def enterEvent(self, event: QEvent):
-        cursor_shape = Qt.ArrowCursor
-        if self.position in [HandlePosition.TOP_LEFT, HandlePosition.BOTTOM_RIGHT]:
-            cursor_shape = Qt.SizeFDiagCursor
-        elif self.position in [HandlePosition.TOP_RIGHT, HandlePosition.BOTTOM_LEFT]:
-            cursor_shape = Qt.SizeBDiagCursor
-        elif self.position in [HandlePosition.TOP, HandlePosition.BOTTOM]:
-            cursor_shape = Qt.SizeVerCursor
-        elif self.position in [HandlePosition.LEFT, HandlePosition.RIGHT]:
-            cursor_shape = Qt.SizeHorCursor
-        
-        self.parent_window.setCursor(cursor_shape)
+        self._set_parent_cursor(_HANDLE_CURSORS[self.position])
         super().enterEvent(event)
 
     def leaveEvent(self, event: QEvent):
-        self.parent_window.setCursor(Qt.ArrowCursor)
+        self._set_parent_cursor(Qt.ArrowCursor)
         super().leaveEvent(event)
 
-    # We will need mousePress, mouseMove, mouseRelease here later for actual resizing.
+    def _set_parent_cursor(self, shape: Qt.CursorShape):
+        # setCursor is a platform round trip; adjacent handles often share a shape
+        if self.parent_window.cursor().shape() != shape:
+            self.parent_window.setCursor(shape)
+
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton and not self.parent_window.isMaximized():
+            # The window system resizes the window itself, so no mouse moves reach Python
+            handle = self.parent_window.windowHandle()
+            if handle is not None and handle.startSystemResize(_EDGE_TABLE[_HANDLE_RESIZE_DIRS[self.position]]):
+                event.accept()
+                return
+            # Platform cannot do it (e.g. offscreen); mouseMoveEvent resizes the window instead
             self.is_dragging = True
             self.drag_start_pos = event.globalPosition().toPoint()
             self.parent_window_start_geometry = self.parent_window.geometry() # QRect
@@ -320,13 +410,28 @@ class EdgeResizeHandle(QWidget):
             if new_geometry.width() < min_width: new_geometry.setWidth(min_width)
             if new_geometry.height() < min_height: new_geometry.setHeight(min_height)
             
-            self.parent_window.setGeometry(new_geometry)
+            # Coalesce the flood of move events; the throttle applies only the latest geometry
+            self._pending_geometry = new_geometry
+            if not self._geometry_throttle.isActive():
+                self._geometry_throttle.start()
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
+    def _apply_pending_geometry(self):
+        # Consecutive moves often collapse to the geometry the window already has
+        if self._pending_geometry is not None and self._pending_geometry != self.parent_window.geometry():
+            if self._pending_geometry.size() == self.parent_window.size():
+                # Size unchanged (e.g. clamped at the minimum): a plain move needs no relayout
+                self.parent_window.move(self._pending_geometry.topLeft())
+            else:
+                self.parent_window.setGeometry(self._pending_geometry)
+        self._pending_geometry = None
+
     def mouseReleaseEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton and self.is_dragging:
+            self._geometry_throttle.stop()
+            self._apply_pending_geometry() # Land exactly where the mouse was released
             self.is_dragging = False
             self.drag_start_pos = None
             self.parent_window_start_geometry = None
@@ -340,16 +445,35 @@ class InteractiveHierarchyLabel(QLabel):
     hover_leave = Signal(QWidget)  # Signal to emit when mouse leaves, passes target widget
     clicked = Signal(QWidget)      # Signal to emit when clicked, passes target widget
 
-    def __init__(self, target_widget: QWidget, text: str, parent=None):
+    def __init__(self, target_widget: QWidget, text: str, parent=None, indent_level: int = 0, tree_flags: int = 0):
         super().__init__(text, parent)
         if isinstance(target_widget, QMenu):
             action = target_widget.menuAction()
             self.target_widget = target_widget
         else:
             self.target_widget = target_widget
+        # Tree lines are drawn at paint time: bit N of tree_flags set means a
+        # vertical line continues through indent slot N.
+        self.indent_level = indent_level
+        self.tree_flags = tree_flags
+        self.indent_step = self.fontMetrics().horizontalAdvance("│   ")
+        self.line_offset = self.fontMetrics().horizontalAdvance("│") // 2 + 1
+        self.setContentsMargins(indent_level * self.indent_step, 0, 0, 0)
         self.setMouseTracking(True) 
         self.setStyleSheet("color: #cccccc; background-color: transparent; padding: 1px;")
 
+    def paintEvent(self, event: QPaintEvent):
+        super().paintEvent(event)
+        if not self.tree_flags:
+            return
+        painter = QPainter(self)
+        painter.setPen(QPen(QColor("#cccccc"), 1))
+        bottom = self.height()
+        for level in range(self.indent_level):
+            if self.tree_flags & (1 << level):
+                x = level * self.indent_step + self.line_offset
+                painter.drawLine(x, 0, x, bottom)
+
     def enterEvent(self, event: QEvent):
         if DEBUG_LOGS: print(f"[Label Hover Enter] Target: {self.target_widget.metaObject().className()} '{self.target_widget.objectName()}'") # Debug ACTIVE
         self.hover_enter.emit(self.target_widget)
@@ -489,7 +613,9 @@ class DrawableScreenshotLabel(QLabel):
         self.setAlignment(Qt.AlignTop | Qt.AlignLeft) # Align pixmap to top-left for drawing
 
     def setPixmap(self, pixmap: QPixmap, offset: Tuple[int, int] = (0, 0)):
-        self.base_pixmap = pixmap.copy() if pixmap else QPixmap()
+        # QPixmap is implicitly shared and base_pixmap is never painted on in
+        # place (getPixmapWithDrawings copies), so no deep copy is needed here.
+        self.base_pixmap = pixmap if pixmap else QPixmap()
         self.drawing_paths = [] # Clear previous drawings when new pixmap is set
         self.offset = offset
         self.update() # Trigger a repaint
@@ -562,7 +688,26 @@ class DrawableScreenshotLabel(QLabel):
             if self.current_path and not self.current_path.isEmpty():
                 painter.drawPath(self.current_path)
 
+INSPECTOR_WINDOW_OBJECT_NAME = "ViewMeshInspectorWindow"
+
+# Dark theme for the inspector, scoped to the inspector window so it can live
+# in the application-wide stylesheet and is parsed only once per process.
+_INSPECTOR_QSS = """
+    #ViewMeshInspectorWindow { background-color: #1e1e1e; color: #cccccc; }
+    #ViewMeshInspectorWindow QTabWidget::pane { border: 1px solid #474747; background-color: #1e1e1e; }
+    #ViewMeshInspectorWindow QTabBar::tab { background-color: #2d2d2d; color: #cccccc; border: 1px solid #474747; padding: 6px 12px; margin-right: 1px; }
+    #ViewMeshInspectorWindow QTabBar::tab:selected { background-color: #1e1e1e; border-bottom-color: #1e1e1e; }
+    #ViewMeshInspectorWindow QLabel { background-color: transparent; color: #cccccc; } /* Default for labels */
+    #ViewMeshInspectorWindow QTextEdit { background-color: #252526; color: #cccccc; border: 1px solid #474747; }
+    #ViewMeshInspectorWindow QPushButton { background-color: #3c3c3c; color: #cccccc; border: 1px solid #555555; padding: 5px; }
+    #ViewMeshInspectorWindow QPushButton:hover { background-color: #4c4c4c; }
+    #ViewMeshInspectorWindow QScrollArea { border: none; background-color: #252526; } /* Style scroll area itself */
+"""
+
 class InspectorWindow(QMainWindow):
+    XML_STREAM_CHUNK_SIZE = 64 * 1024  # Characters inserted per chunk when filling the XML view
+    _qss_installed: ClassVar[bool] = False  # Set once _INSPECTOR_QSS is part of the app stylesheet
+
     def __init__(self, main_app_window: QMainWindow, parent=None):
         super().__init__(parent)
         self.main_app_window = main_app_window
@@ -652,24 +797,31 @@ class InspectorWindow(QMainWindow):
 
         self.tab_widget.addTab(self.screenshot_tab, "Screenshot")
 
-        # Apply overall dark theme to InspectorWindow and its main components
-        self.setStyleSheet("""
-            QMainWindow { background-color: #1e1e1e; color: #cccccc; }
-            QTabWidget::pane { border: 1px solid #474747; background-color: #1e1e1e; }
-            QTabBar::tab { background-color: #2d2d2d; color: #cccccc; border: 1px solid #474747; padding: 6px 12px; margin-right: 1px; }
-            QTabBar::tab:selected { background-color: #1e1e1e; border-bottom-color: #1e1e1e; }
-            QLabel { background-color: transparent; color: #cccccc; } /* Default for labels */
-            QTextEdit { background-color: #252526; color: #cccccc; border: 1px solid #474747; }
-            QPushButton { background-color: #3c3c3c; color: #cccccc; border: 1px solid #555555; padding: 5px; }
-            QPushButton:hover { background-color: #4c4c4c; }
-            QScrollArea { border: none; background-color: #252526; } /* Style scroll area itself */
-        """)
+        # Apply overall dark theme to InspectorWindow and its main components.
+        # The rules are installed on the application once, scoped by object name.
+        self.setObjectName(INSPECTOR_WINDOW_OBJECT_NAME)
+        if not InspectorWindow._qss_installed:
+            app = QApplication.instance()
+            app.setStyleSheet(app.styleSheet() + _INSPECTOR_QSS)
+            InspectorWindow._qss_installed = True
 
     def _refresh_xml_hierarchy_view(self):
         self.xml_hierarchy_text_edit.setVisible(True)
         self.visual_tree_scroll_area.setVisible(False)
         xml_data = self._generate_widget_hierarchy_xml()
-        self.xml_hierarchy_text_edit.setPlainText(xml_data)
+
+        # Insert the dump into the document in chunks rather than handing one
+        # large string to setPlainText; the view repaints once, when updates resume.
+        text_edit = self.xml_hierarchy_text_edit
+        text_edit.setUpdatesEnabled(False)
+        try:
+            doc = text_edit.document()
+            doc.clear()
+            cursor = QTextCursor(doc)
+            for start in range(0, len(xml_data), self.XML_STREAM_CHUNK_SIZE):
+                cursor.insertText(xml_data[start:start + self.XML_STREAM_CHUNK_SIZE])
+        finally:
+            text_edit.setUpdatesEnabled(True)
 
     def _refresh_visual_tree_view(self):
         self.xml_hierarchy_text_edit.setVisible(False)
@@ -689,10 +841,10 @@ class InspectorWindow(QMainWindow):
             return
 
         # Start building the visual tree UI from the main_app_window
-        # prefix_parts will store the "│   " or "    " for each indent level
-        self._build_visual_widget_ui(self.main_app_window, 0, self.visual_tree_layout, []) 
+        # tree_flags holds one bit per indent level for the vertical lines drawn by each label
+        self._build_visual_widget_ui(self.main_app_window, 0, self.visual_tree_layout, 0) 
 
-    def _build_visual_widget_ui(self, widget: QWidget, indent_level: int, parent_layout: QVBoxLayout, prefix_parts: list[str]):
+    def _build_visual_widget_ui(self, widget: QWidget, indent_level: int, parent_layout: QVBoxLayout, tree_flags: int):
         class_name = widget.metaObject().className()
         object_name = widget.objectName() or ""
         geom = widget.geometry()
@@ -701,7 +853,8 @@ class InspectorWindow(QMainWindow):
         attributes = []
         if object_name:
             attributes.append(f"name=\"{object_name.replace('\"', '&quot;')}\"")
-        attributes.append(f"geom=({geom.x()},{geom.y()},{geom.width()},{geom.height()})")
+        x, y, w, h = geom.getRect()
+        attributes.append(f"geom=({x},{y},{w},{h})")
         
         if hasattr(widget, 'text') and callable(widget.text):
             try:
@@ -711,7 +864,6 @@ class InspectorWindow(QMainWindow):
             except Exception: pass
         
         attr_string = " ".join(attributes)
-        current_prefix = "".join(prefix_parts)
         label_text_content = f"{class_name} [{attr_string}]"
 
         # Create and add the interactive label
@@ -720,7 +872,7 @@ class InspectorWindow(QMainWindow):
             if DEBUG_LOGS: print(f"    isVisible: {widget.isVisible()}, isVisibleTo_parent: {widget.isVisibleTo(self.main_app_window)}")
             if DEBUG_LOGS: print(f"    geometry: {widget.geometry()}, mapToGlobal(0,0): {widget.mapToGlobal(QPoint(0,0))}")
 
-        hierarchy_label = InteractiveHierarchyLabel(widget, f"{current_prefix}{label_text_content}")
+        hierarchy_label = InteractiveHierarchyLabel(widget, label_text_content, indent_level=indent_level, tree_flags=tree_flags)
         hierarchy_label.hover_enter.connect(self._on_hierarchy_label_hover_enter)
         hierarchy_label.hover_leave.connect(self._on_hierarchy_label_hover_leave)
         hierarchy_label.clicked.connect(self._on_hierarchy_label_clicked)
@@ -735,16 +887,17 @@ class InspectorWindow(QMainWindow):
                     children_qwidgets.append(child_obj)
                 elif isinstance(child_obj, QAction):
                     #children_qwidgets.append()
-                    action: QAction = child_obj
-                    menu = action.menu()
-                    if menu:
-                        menu_parent = menu.parent()
-                    else:
-                        menu_parent = None
-                    title = action.text()
-                    print(f"    Skipping QAction child: {type(child_obj)} parent: {type(widget)} menu: {type(menu)} menu_parent: {type(menu_parent)} title: {title}") 
+                    if log.isEnabledFor(logging.DEBUG):
+                        action: QAction = child_obj
+                        menu = action.menu()
+                        if menu:
+                            menu_parent = menu.parent()
+                        else:
+                            menu_parent = None
+                        log.debug("    Skipping QAction child: %s parent: %s menu: %s menu_parent: %s title: %s",
+                                  type(child_obj), type(widget), type(menu), type(menu_parent), action.text())
                 else:
-                    print(f"    Skipping non-QWidget child: {type(child_obj)}") 
+                    log.debug("    Skipping non-QWidget child: %s", type(child_obj))
 
         # Recursively process children
         num_children = len(children_qwidgets)
@@ -755,63 +908,12 @@ class InspectorWindow(QMainWindow):
                 continue 
 
             is_last_child = (i == num_children - 1)
-            
-            new_prefix_parts = prefix_parts.copy()
-            if indent_level > 0: # For children of the root, their prefix is based on their parent's state
-                 # This logic might need refinement if prefix_parts wasn't managed correctly by caller for root
-                 # For simplicity, let's adjust the last element of prefix_parts before passing down
-                 pass # The logic for updating prefix_parts for drawing lines will be more complex
-           
-            # Simplified prefix for now, actual line drawing characters need more state
-            # For the text label, we just add standard indent for now
-            # The visual lines would typically be drawn *by* the label or a container
-           
-            # Determine the correct prefix characters for text representation
-            # This is a simplified text representation of tree lines
-            line_prefix = "    " * indent_level
-            if indent_level > 0: # Not for root
-                if is_last_child:
-                    line_prefix = ("    " * (indent_level -1)) + "└── " 
-                else:
-                    line_prefix = ("    " * (indent_level -1)) + "├── " 
-           
-            # Re-create the label with the tree structure characters
-            # This is a bit redundant with current structure; ideally, the label itself handles this.
-            # For now, we reconstruct the text for the label being added to the layout.
-            # This is incorrect: hierarchy_label was already added. We need to set its text again or create new.
-            # Let's simplify: the label text will be set once with current_prefix, which needs to be built correctly.
-
-            # Correct approach: build the full prefix string for *this* level before creating the label
-            # The `prefix_parts` passed down should reflect parent connections
-           
-            # Let's defer complex line drawing logic. For now, use simple spacing for indentation in text label.
-            # The earlier label creation already uses `current_prefix` which is `"    " * indent_level` effectively
-            # We need to pass child_prefix_parts to the recursive call.
-
-            child_prefix_parts = prefix_parts.copy()
-            if is_last_child:
-                child_prefix_parts.append("    ")
-            else:
-                child_prefix_parts.append("│   ") # Vertical line and space
-
-            # The label for the current widget should use the current prefix_parts correctly
-            # Let's refine the label text creation for the current widget
-            current_branch_char = ""
-            if indent_level > 0: # Not for root
-                if prefix_parts: # Safety check
-                    # Determine current widget's branch based on its parent's prefix part that corresponds to this level
-                    # This is tricky because prefix_parts is for *children*. We need to know if *current* is last.
-                    # This requires knowing if the widget itself is the last child of ITS parent.
-                    # This information needs to be passed into _build_visual_widget_ui. Let's add `is_parent_last_child`
-                    # Or simpler: `is_current_widget_last_child`
-                    pass # Deferring complex line drawing to focus on hover
-
-            # Update the label that was already created, or create it with proper prefix
-            # For now, the previous label creation is what stands. Complex lines are for later. 
-            # The text in the InteractiveHierarchyLabel will just use space indentation from `current_prefix`
-            # For the recursive call, we manage `prefix_parts` to guide children.
-
-            self._build_visual_widget_ui(child_widget, indent_level + 1, parent_layout, child_prefix_parts)
+
+            child_tree_flags = tree_flags
+            if not is_last_child:
+                child_tree_flags |= 1 << indent_level # Vertical line continues through this level
+
+            self._build_visual_widget_ui(child_widget, indent_level + 1, parent_layout, child_tree_flags)
 
     def _generate_widget_hierarchy_xml(self) -> str:
         if not self.main_app_window:
@@ -826,8 +928,7 @@ class InspectorWindow(QMainWindow):
         object_name = widget.objectName()
         geometry = widget.geometry()
 
-        # DEBUG: Print current widget being processed (ACTIVE BY DEFAULT)
-        print(f"{indent}Processing: {class_name} name='{object_name or ''}' geom={geometry}")
+        log.debug("%sProcessing: %s name=%r geom=%s", indent, class_name, object_name or '', geometry)
 
         xml_string = f'''{indent}<{class_name} '''
         if object_name:
@@ -859,7 +960,8 @@ class InspectorWindow(QMainWindow):
             except Exception:
                 pass
 
-        xml_string += f'geometry="({geometry.x()},{geometry.y()},{geometry.width()},{geometry.height()})">' 
+        x, y, w, h = geometry.getRect()
+        xml_string += f'geometry="({x},{y},{w},{h})">' 
         xml_string += '\n'
         
         if isinstance(widget, QTabWidget):
@@ -889,11 +991,12 @@ class InspectorWindow(QMainWindow):
                     # If this still doesn't work, the issue might be deeper in widget parenting.
                     actual_qwidget_children.append(child_obj)
         
-        # DEBUG: Print found children (ACTIVE BY DEFAULT)
-        if actual_qwidget_children:
-            print(f"{indent}  Children of {class_name} ('{object_name or ''}'): {[c.metaObject().className() + (' ('+c.objectName()+')' if c.objectName() else '') for c in actual_qwidget_children]}")
-        else:
-            print(f"{indent}  No QWidget children for {class_name} ('{object_name or ''}') found via .children() filtering")
+        if log.isEnabledFor(logging.DEBUG):
+            if actual_qwidget_children:
+                log.debug("%s  Children of %s (%r): %s", indent, class_name, object_name or '',
+                          [c.metaObject().className() + (' ('+c.objectName()+')' if c.objectName() else '') for c in actual_qwidget_children])
+            else:
+                log.debug("%s  No QWidget children for %s (%r) found via .children() filtering", indent, class_name, object_name or '')
 
 
         if actual_qwidget_children:
@@ -906,8 +1009,8 @@ class InspectorWindow(QMainWindow):
                     child_obj_name = child_widget.objectName() if child_widget.objectName() else ''
                     safe_child_obj_name = child_obj_name.replace('"', '&quot;')
                     pos_name = child_widget.position.name if hasattr(child_widget, 'position') and child_widget.position else 'N/A'
-                    child_geom = child_widget.geometry()
-                    geom_str = f"({child_geom.x()},{child_geom.y()},{child_geom.width()},{child_geom.height()})"
+                    cx, cy, cw, ch = child_widget.geometry().getRect()
+                    geom_str = f"({cx},{cy},{cw},{ch})"
                     xml_string += f'''{indent}  <{child_widget.metaObject().className()} name="{safe_child_obj_name}" geometry="{geom_str}" position="{pos_name}" />\n'''
                     continue
                 xml_string += self._build_widget_xml_string(child_widget, indent_level + 1)
@@ -971,9 +1074,8 @@ class InspectorWindow(QMainWindow):
         if self.highlight_overlay:
             self.highlight_overlay.hide()
         self.geometry_manager.save_geometry() 
-        self.config.save() 
-        if hasattr(self.main_app_window, 'inspector_window_instance'):
-            self.main_app_window.inspector_window_instance = None
+        self.main_app_window.save_window_state() # Written with the main window's next debounced save
+        self.main_app_window.inspector_window_instance = None
         super().closeEvent(event)    
         
     def _take_screenshot(self):
@@ -1003,7 +1105,7 @@ class InspectorWindow(QMainWindow):
             
         except Exception as e:
             error_message = f"Error taking screenshot: {e}"
-            print(f"Screenshot Error: {error_message}") # Keep a print for debugging
+            log.error("Screenshot Error: %s", error_message)
             self.screenshot_display_label.setText(error_message)
             self.save_screenshot_button.setEnabled(False)
             self.clear_drawings_button.setEnabled(False)
@@ -1048,6 +1150,77 @@ class InspectorWindow(QMainWindow):
 # Need to modify ViewMeshApp to call overlay.update_geometry() during its resizeEvent
 # And also potentially when the inspector is first shown.
 
+def _parse_tuple_str(value: str, element_type: type, n: int) -> Optional[Tuple]:
+    """Parse a "(a, b, ...)" string as stored by older versions; None if malformed."""
+    try:
+        vals = tuple(element_type(part) for part in value.strip("()").split(","))
+    except ValueError:
+        return None
+    return vals if len(vals) == n else None
+
+def _int_tuple(value: Any, n: int) -> Optional[Tuple[int, ...]]:
+    """Tuple from a stored QSize, QPoint or QRect, or from an older "(a, b)" string;
+    None if the value is missing or unusable."""
+    if isinstance(value, QSize):
+        vals = (value.width(), value.height())
+    elif isinstance(value, QPoint):
+        vals = (value.x(), value.y())
+    elif isinstance(value, QRect):
+        vals = (value.x(), value.y(), value.width(), value.height())
+    elif isinstance(value, str):
+        return _parse_tuple_str(value, int, n)
+    else:
+        return None
+    return vals if len(vals) == n else None
+
+def _relative_position(snap: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """relative_x/relative_y from a settings snapshot, or the "(x, y)" relative_position
+    string older versions stored; None if neither is usable."""
+    if "relative_x" in snap and "relative_y" in snap:
+        try:
+            return (float(snap["relative_x"]), float(snap["relative_y"])) # INI backends return strings
+        except (TypeError, ValueError):
+            return None
+    legacy = snap.get("relative_position")
+    if isinstance(legacy, str):
+        return _parse_tuple_str(legacy, float, 2)
+    return None
+
+# Canonical form of each value known to be stored, keyed by full settings key.
+# Seeded by _snapshot() and updated by _set_if_changed() so unchanged values are not rewritten.
+_stored_values: Dict[str, Any] = {}
+
+def _canonical(value: Any) -> Any:
+    """Comparable form of a settings value that sidesteps QVariant equality quirks."""
+    if isinstance(value, (bytes, bytearray, QByteArray)):
+        return bytes(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+def _set_if_changed(settings: QSettings, key: str, value: Any) -> None:
+    canonical = _canonical(value)
+    if _stored_values.get(key) != canonical:
+        settings.setValue(key, value)
+        _stored_values[key] = canonical
+
+def _snapshot(settings: QSettings, prefix: str) -> Dict[str, Any]:
+    """Read every key under the given group in one pass into a plain dict."""
+    settings.beginGroup(prefix)
+    try:
+        snap = {key: settings.value(key) for key in settings.allKeys()}
+    finally:
+        settings.endGroup()
+    for key, value in snap.items():
+        _stored_values[f"{prefix}/{key}"] = _canonical(value)
+    return snap
+
+def _setting_to_bool(value: Any) -> bool:
+    """Convert a raw QSettings value to bool (INI backends return strings)."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1")
+    return bool(value)
+
 @dataclass
 class WindowSettings:
     """Store window position, size and state."""
@@ -1061,113 +1234,52 @@ class WindowSettings:
     screen_geometry: Tuple[int, int, int, int] = (0, 0, 0, 0)  # x, y, width, height of screen
     global_font_size_adjust: int = 0 # New field
     
-    @staticmethod
-    def _parse_tuple_setting(
-        settings: QSettings, 
-        key: str, 
-        element_type: type, 
-        num_elements: int,
-        default_tuple_value: Tuple 
-    ) -> Tuple:
-        raw_value = settings.value(key) # QSettings.value() returns None if key not found
-
-        if raw_value is None: # Key not found
-            # Optional: print(f"Setting '{key}' not found. Using default {default_tuple_value}.")
-            return default_tuple_value
-
-        try:
-            # Ensure the value is treated as a string for parsing
-            value_str = str(raw_value)
-            if not isinstance(raw_value, str):
-                # Log a warning if the original type wasn't a string, as it's unexpected for this parsing logic.
-                print(f"Warning: Setting '{key}' (original value: '{raw_value}') had type {type(raw_value)}, parsed as string '{value_str}'.")
-
-            parts = value_str.strip("()").split(",")
-            if len(parts) != num_elements:
-                raise ValueError(f"String '{value_str}' derived from setting '{key}' does not have {num_elements} parts after splitting")
-            
-            # Construct the tuple with the specified element type, stripping whitespace from each part
-            parsed_elements = tuple(element_type(p.strip()) for p in parts)
-            return parsed_elements
-        except Exception as e:
-            print(f"Error parsing setting '{key}' (raw value: '{raw_value}'): {e}. Using default {default_tuple_value}.")
-            return default_tuple_value
-
     @classmethod
     def from_settings(cls, settings: QSettings) -> 'WindowSettings':
         """Load window settings from QSettings."""
         result = cls()
-        if settings.contains("window/size"):
-            size = settings.value("window/size")
-            if isinstance(size, QSize):
-                result.size = (size.width(), size.height())
-            elif isinstance(size, str):
-                # Handle potential string serialization
-                parts = size.strip("()").split(",")
-                if len(parts) == 2:
-                    result.size = (int(parts[0]), int(parts[1]))
-        
-        if settings.contains("window/position"):
-            pos = settings.value("window/position")
-            if isinstance(pos, QPoint):
-                result.position = (pos.x(), pos.y())
-            elif isinstance(pos, str):
-                # Handle potential string serialization
-                parts = pos.strip("()").split(",")
-                if len(parts) == 2:
-                    result.position = (int(parts[0]), int(parts[1]))
-        
-        # Replace the previous block for relative_position with a call to the helper
-        # result.relative_position already holds the dataclass default (e.g., (0.1, 0.1))
-        # This default is passed to the helper to be returned if key is missing or parsing fails.
-        result.relative_position = cls._parse_tuple_setting(
-            settings,
-            "window/relative_position",
-            element_type=float,
-            num_elements=2,
-            default_tuple_value=result.relative_position # Pass current default as the fallback
-        )
+        snap = _snapshot(settings, "window")
+
+        result.size = _int_tuple(snap.get("size"), 2) or result.size
+        result.position = _int_tuple(snap.get("position"), 2) or result.position
+        result.relative_position = _relative_position(snap) or result.relative_position
         
-        if settings.contains("window/is_maximized"):
-            result.is_maximized = settings.value("window/is_maximized", False, type=bool)
+        if "is_maximized" in snap:
+            result.is_maximized = _setting_to_bool(snap["is_maximized"])
         
-        if settings.contains("window/explorer_width"):
-            result.explorer_width = settings.value("window/explorer_width", 250, type=int)
+        if "explorer_width" in snap:
+            result.explorer_width = int(snap["explorer_width"])
         
-        if settings.contains("window/state"):
-            result.state = settings.value("window/state")
+        if "state" in snap:
+            # Stored natively as a byte array; a str here is a legacy/foreign value restoreState cannot use
+            state = snap["state"]
+            if isinstance(state, (bytes, bytearray, QByteArray)):
+                result.state = bytes(state)
         
-        if settings.contains("window/screen_name"):
-            result.screen_name = settings.value("window/screen_name", "")
+        if "screen_name" in snap:
+            result.screen_name = str(snap["screen_name"])
         
-        # Replace the previous block for screen_geometry with a call to the helper
-        # result.screen_geometry already holds the dataclass default (e.g., (0,0,0,0))
-        result.screen_geometry = cls._parse_tuple_setting(
-            settings,
-            "window/screen_geometry",
-            element_type=int,
-            num_elements=4,
-            default_tuple_value=result.screen_geometry # Pass current default as fallback
-        )
+        result.screen_geometry = _int_tuple(snap.get("screen_geometry"), 4) or result.screen_geometry
         
-        if settings.contains("window/global_font_size_adjust"):
-            result.global_font_size_adjust = settings.value("window/global_font_size_adjust", 0, type=int)
+        if "global_font_size_adjust" in snap:
+            result.global_font_size_adjust = int(snap["global_font_size_adjust"])
         
         return result
     
     def save_to_settings(self, settings: QSettings) -> None:
         """Save window settings to QSettings."""
-        settings.setValue("window/size", QSize(*self.size))
-        settings.setValue("window/position", QPoint(*self.position))
-        settings.setValue("window/relative_position", str(self.relative_position))
-        settings.setValue("window/is_maximized", self.is_maximized)
-        settings.setValue("window/explorer_width", self.explorer_width)
-        settings.setValue("window/screen_name", self.screen_name)
-        # Store screen geometry as a string to avoid Qt serialization issues
-        settings.setValue("window/screen_geometry", str(self.screen_geometry))
-        settings.setValue("window/global_font_size_adjust", self.global_font_size_adjust) # Save new field
+        _set_if_changed(settings, "window/size", QSize(*self.size))
+        _set_if_changed(settings, "window/position", QPoint(*self.position))
+        _set_if_changed(settings, "window/relative_x", self.relative_position[0])
+        _set_if_changed(settings, "window/relative_y", self.relative_position[1])
+        _set_if_changed(settings, "window/is_maximized", self.is_maximized)
+        _set_if_changed(settings, "window/explorer_width", self.explorer_width)
+        _set_if_changed(settings, "window/screen_name", self.screen_name)
+        _set_if_changed(settings, "window/screen_geometry", QRect(*self.screen_geometry))
+        _set_if_changed(settings, "window/global_font_size_adjust", self.global_font_size_adjust) # Save new field
         if self.state:
-            settings.setValue("window/state", self.state)
+            # As a QByteArray: PySide would store plain bytes as a pickled PyObjectWrapper
+            _set_if_changed(settings, "window/state", QByteArray(self.state))
 
 @dataclass
 class InspectorWindowSettings:
@@ -1181,69 +1293,34 @@ class InspectorWindowSettings:
     @classmethod
     def from_settings(cls, settings: QSettings, prefix: str = "inspector_window/") -> 'InspectorWindowSettings':
         """Load inspector window settings from QSettings."""
+        return cls.from_snapshot(_snapshot(settings, prefix.rstrip("/")))
+
+    @classmethod
+    def from_snapshot(cls, snap: Dict[str, Any]) -> 'InspectorWindowSettings':
+        """Build inspector window settings from a _snapshot() of their settings group."""
         result = cls()
-        size_key = f"{prefix}size"
-        pos_key = f"{prefix}position"
-        rel_pos_key = f"{prefix}relative_position"
-        screen_name_key = f"{prefix}screen_name"
-        screen_geom_key = f"{prefix}screen_geometry"
-
-        if settings.contains(size_key):
-            size_val = settings.value(size_key)
-            if isinstance(size_val, QSize):
-                result.size = (size_val.width(), size_val.height())
-            elif isinstance(size_val, str):
-                try:
-                    parts = size_val.strip("()").split(",")
-                    if len(parts) == 2:
-                        result.size = (int(parts[0].strip()), int(parts[1].strip()))
-                except ValueError:
-                    print(f"Warning: Could not parse inspector size string: {size_val}")
-            elif isinstance(size_val, (list, tuple)) and len(size_val) == 2:
-                 result.size = (int(size_val[0]), int(size_val[1]))
-
-        if settings.contains(pos_key):
-            pos_val = settings.value(pos_key)
-            if isinstance(pos_val, QPoint):
-                result.position = (pos_val.x(), pos_val.y())
-            elif isinstance(pos_val, str):
-                try:
-                    parts = pos_val.strip("()").split(",")
-                    if len(parts) == 2:
-                        result.position = (int(parts[0].strip()), int(parts[1].strip()))
-                except ValueError:
-                    print(f"Warning: Could not parse inspector position string: {pos_val}")
-            elif isinstance(pos_val, (list, tuple)) and len(pos_val) == 2:
-                result.position = (int(pos_val[0]), int(pos_val[1]))
-
-        # Use the helper from WindowSettings for tuple parsing
-        result.relative_position = WindowSettings._parse_tuple_setting(
-            settings,
-            rel_pos_key,
-            element_type=float,
-            num_elements=2,
-            default_tuple_value=result.relative_position
-        )
+        result.size = _int_tuple(snap.get("size"), 2) or result.size
+        result.position = _int_tuple(snap.get("position"), 2) or result.position
+        result.relative_position = _relative_position(snap) or result.relative_position
 
-        if settings.contains(screen_name_key):
-            result.screen_name = settings.value(screen_name_key, "", type=str)
+        if "screen_name" in snap:
+            result.screen_name = str(snap["screen_name"])
 
-        result.screen_geometry = WindowSettings._parse_tuple_setting(
-            settings,
-            screen_geom_key,
-            element_type=int,
-            num_elements=4,
-            default_tuple_value=result.screen_geometry
-        )
+        result.screen_geometry = _int_tuple(snap.get("screen_geometry"), 4) or result.screen_geometry
         return result
 
     def save_to_settings(self, settings: QSettings, prefix: str = "inspector_window/") -> None:
         """Save inspector window settings to QSettings."""
-        settings.setValue(f"{prefix}size", QSize(*self.size))
-        settings.setValue(f"{prefix}position", QPoint(*self.position)) # Save absolute as well
-        settings.setValue(f"{prefix}relative_position", str(self.relative_position))
-        settings.setValue(f"{prefix}screen_name", self.screen_name)
-        settings.setValue(f"{prefix}screen_geometry", str(self.screen_geometry))
+        _set_if_changed(settings, f"{prefix}size", QSize(*self.size))
+        _set_if_changed(settings, f"{prefix}position", QPoint(*self.position)) # Save absolute as well
+        _set_if_changed(settings, f"{prefix}relative_x", self.relative_position[0])
+        _set_if_changed(settings, f"{prefix}relative_y", self.relative_position[1])
+        _set_if_changed(settings, f"{prefix}screen_name", self.screen_name)
+        _set_if_changed(settings, f"{prefix}screen_geometry", QRect(*self.screen_geometry))
+
+# Process-wide AppConfig shared by every AppConfig.load() caller
+_CONFIG_SINGLETON: Optional['AppConfig'] = None
+_CONFIG_LOCK = threading.Lock()
 
 @dataclass
 class AppConfig:
@@ -1251,36 +1328,65 @@ class AppConfig:
     app_name: str = "ViewMesh"
     org_name: str = "AnchorSCAD"
     settings: WindowSettings = field(default_factory=WindowSettings)
-    inspector_settings: InspectorWindowSettings = field(default_factory=InspectorWindowSettings) # Added
-    initial_dir: str = field(default_factory=lambda: str(Path.home()))
+    initial_dir: str = field(default_factory=lambda: _HOME_DIR)
+    # Inspector settings are only parsed when first accessed, see inspector_settings
+    _inspector_settings: Optional[InspectorWindowSettings] = field(default=None, init=False, repr=False)
+    # Plain values of the inspector_window group, read by load() on whichever thread runs it
+    _inspector_snapshot: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def inspector_settings(self) -> InspectorWindowSettings:
+        if self._inspector_settings is None:
+            if self._inspector_snapshot is not None:
+                self._inspector_settings = InspectorWindowSettings.from_snapshot(self._inspector_snapshot)
+            else:
+                self._inspector_settings = InspectorWindowSettings()
+        return self._inspector_settings
+
+    @inspector_settings.setter
+    def inspector_settings(self, value: InspectorWindowSettings) -> None:
+        self._inspector_settings = value
     
     @classmethod
     def load(cls) -> 'AppConfig':
-        """Load configuration from settings."""
-        config = cls()
-        settings = QSettings(config.org_name, config.app_name)
-        config.settings = WindowSettings.from_settings(settings)
-        config.inspector_settings = InspectorWindowSettings.from_settings(settings) # Added
-        if settings.contains("app/initial_dir"):
-            config.initial_dir = settings.value("app/initial_dir")
-        return config
+        """Load configuration from settings, once per process."""
+        global _CONFIG_SINGLETON
+        with _CONFIG_LOCK:
+            if _CONFIG_SINGLETON is None:
+                config = cls()
+                settings = QSettings(config.org_name, config.app_name)
+                config.settings = WindowSettings.from_settings(settings)
+                # Only plain values leave this function, so load() may run on a pool thread
+                config._inspector_snapshot = _snapshot(settings, "inspector_window")
+                if settings.contains("app/initial_dir"):
+                    config.initial_dir = settings.value("app/initial_dir")
+                    _stored_values["app/initial_dir"] = _canonical(config.initial_dir)
+                _CONFIG_SINGLETON = config
+            return _CONFIG_SINGLETON
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached configuration so the next load() re-reads settings."""
+        global _CONFIG_SINGLETON
+        with _CONFIG_LOCK:
+            _CONFIG_SINGLETON = None
     
     def save(self) -> None:
-        """Save configuration to settings."""
-        settings = QSettings(self.org_name, self.app_name)
+        """Queue the configuration for writing; the disk I/O happens off the GUI thread."""
+        settings = SettingsWriter(self.org_name, self.app_name)
         self.settings.save_to_settings(settings)
-        self.inspector_settings.save_to_settings(settings) # Added
-        settings.setValue("app/initial_dir", self.initial_dir)
+        if self._inspector_settings is not None: # Untouched inspector settings are left as stored
+            self._inspector_settings.save_to_settings(settings)
+        _set_if_changed(settings, "app/initial_dir", self.initial_dir)
 
-@dataclass
 class FileExplorerWidget(QWidget):
     """File explorer widget similar to VSCode."""
-    parent: Optional[QWidget] = None
-    initial_dir: str = field(default_factory=lambda: str(Path.home()))
-    file_selected: ClassVar[Signal] = Signal(str)
+    file_selected = Signal(str)
+    _shared_model: Optional[QFileSystemModel] = None
 
-    def __post_init__(self):
-        super().__init__(self.parent)
+    def __init__(self, parent: Optional[QWidget] = None, initial_dir: Optional[str] = None):
+        super().__init__(parent)
+        self.initial_dir = initial_dir if initial_dir is not None else _HOME_DIR
         self.setup_ui()
     
     def setup_ui(self):
@@ -1288,9 +1394,11 @@ class FileExplorerWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create file system model
-        self.model = QFileSystemModel()
-        self.model.setRootPath(self.initial_dir)
+        # One model (and its file watcher) is shared by every explorer; each view is scoped by its root index
+        if FileExplorerWidget._shared_model is None:
+            FileExplorerWidget._shared_model = QFileSystemModel()
+            FileExplorerWidget._shared_model.setRootPath("")
+        self.model = FileExplorerWidget._shared_model
         
         # Create tree view
         self.tree_view = QTreeView()
@@ -1302,11 +1410,14 @@ class FileExplorerWidget(QWidget):
         
         # Only show the file name column initially
         self.tree_view.setHeaderHidden(True)
+        # One header repaint for the whole batch; signals stay live since the view tracks them
+        header = self.tree_view.header()
+        header.setUpdatesEnabled(False)
         for i in range(1, self.model.columnCount()):
-            self.tree_view.hideColumn(i)
+            header.setSectionHidden(i, True)
+        header.setUpdatesEnabled(True)
         
         # Connect signals
-        self.tree_view.clicked.connect(self._on_item_clicked)
         self.tree_view.doubleClicked.connect(self._on_item_double_clicked)
         
         # Set consistent font for tree view items - REMOVE FIXED SIZE
@@ -1322,21 +1433,36 @@ class FileExplorerWidget(QWidget):
         layout.addWidget(self.tree_view)
         self.setLayout(layout)
     
-    def _on_item_clicked(self, index: QModelIndex):
-        """Handle item clicked event."""
-        file_path = self.model.filePath(index)
-    
     def _on_item_double_clicked(self, index: QModelIndex):
         """Handle item double clicked event."""
-        file_path = self.model.filePath(index)
-        if os.path.isfile(file_path):
-            self.file_selected.emit(file_path)
+        info = self.model.fileInfo(index)
+        if info.isFile():
+            self.file_selected.emit(info.absoluteFilePath())
     
     def set_root_path(self, path: str):
         """Set the root path for the file explorer."""
-        self.model.setRootPath(path)
+        # Re-rooting the model rescans and re-registers its watcher, so only do it when the
+        # path lies outside what the model already covers (an empty root covers everything)
+        root = self.model.rootPath()
+        if root:
+            try:
+                covered = os.path.commonpath([os.path.abspath(root), os.path.abspath(path)]) == os.path.abspath(root)
+            except ValueError: # Different drives
+                covered = False
+            if not covered:
+                self.model.setRootPath(path)
         self.tree_view.setRootIndex(self.model.index(path))
 
+_TITLEBAR_QSS = """
+    CustomTitleBar {
+        background-color: #252526;
+        border-bottom: 1px solid #1e1e1e;
+    }
+    QLabel {
+        background: transparent;
+    }
+"""
+
 class CustomTitleBar(QWidget):
     """Custom title bar for dock widgets to ensure consistent font styling."""
     
@@ -1350,19 +1476,14 @@ class CustomTitleBar(QWidget):
         
         # Create a small "folder" icon for the Explorer
         # We'll use a unicode character instead of loading an image
-        icon_label = QLabel("📁")
+        icon_label = QLabel()
+        icon_label.setPixmap(_icon("folder").pixmap(16, 16))
         icon_label.setFixedWidth(20)
-        font = icon_label.font()
-        # font.setPointSize(10) # Allow inheritance
-        icon_label.setFont(font)
         icon_label.setStyleSheet("color: #ffffff;")  # Brighter color for better contrast
         
         # Title label
         self.title_label = QLabel(title)
-        font = self.title_label.font()
-        # font.setPointSize(10) # Allow inheritance
-        font.setBold(True) 
-        self.title_label.setFont(font)
+        self.title_label.setFont(_bold_font())
         self.title_label.setStyleSheet("color: #ffffff;")  # Brighter color for better contrast
         
         layout.addWidget(icon_label)
@@ -1370,21 +1491,40 @@ class CustomTitleBar(QWidget):
         layout.addStretch()
         
         # Set background color with VS Code-like style
-        self.setStyleSheet("""
-            CustomTitleBar {
-                background-color: #252526;
-                border-bottom: 1px solid #1e1e1e;
-            }
-            QLabel {
-                background: transparent;
-            }
-        """)
+        self.setStyleSheet(_TITLEBAR_QSS)
         
         # Set fixed height for consistency with VS Code
         self.setFixedHeight(24)  # Reduced from 30
         
         self.setLayout(layout)
 
+_WINDOWFRAME_TITLE_BAR_QSS = """
+    QWidget {
+        background-color: #383838;
+        color: #cccccc;
+    }
+    QPushButton {
+        border: none;
+        border-radius: 0px;
+        background-color: #383838;
+        color: #cccccc;
+    }
+    QPushButton:hover {
+        background-color: #505050;
+    }
+    QPushButton#close_button:hover {
+        background-color: #e81123;
+        color: white;
+    }
+"""
+
+_WINDOWFRAME_QSS = """
+    CustomWindowFrame {
+        border: 1px solid #1e1e1e;
+        background-color: #252526;
+    }
+"""
+
 class CustomWindowFrame(QWidget):
     """Custom window frame for VS Code-like appearance."""
     def __init__(self, parent=None):
@@ -1407,7 +1547,7 @@ class CustomWindowFrame(QWidget):
         
         # Application icon
         self.icon_label = QLabel()
-        self.icon_label.setText("🪟")  # Unicode symbol for window
+        self.icon_label.setPixmap(_icon("window").pixmap(16, 16))
         self.icon_label.setFixedSize(20, 20)
         self.icon_label.setAlignment(Qt.AlignCenter)
         self.title_bar_layout.addWidget(self.icon_label)
@@ -1415,9 +1555,7 @@ class CustomWindowFrame(QWidget):
         
         # Window title
         self.title_label = QLabel("ViewMesh")
-        title_font = self.title_label.font()
-        title_font.setPointSize(9)
-        self.title_label.setFont(title_font)
+        self.title_label.setFont(_small_font())
         self.title_bar_layout.addWidget(self.title_label)
         self.title_bar_layout.addStretch()
         
@@ -1426,19 +1564,19 @@ class CustomWindowFrame(QWidget):
         button_height = 22  # Reduced from 30 to 22 for a more compact look
         
         # Minimize button
-        self.minimize_button = QPushButton("─")
+        self.minimize_button = QPushButton(_icon("minimize"), "")
         self.minimize_button.setFixedSize(button_size, button_height)
         self.minimize_button.setFlat(True)
         self.minimize_button.clicked.connect(self.on_minimize)
         
         # Maximize/restore button
-        self.maximize_button = QPushButton("□")
+        self.maximize_button = QPushButton(_icon("maximize"), "")
         self.maximize_button.setFixedSize(button_size, button_height)
         self.maximize_button.setFlat(True)
         self.maximize_button.clicked.connect(self.on_maximize_restore)
         
         # Close button
-        self.close_button = QPushButton("✕")
+        self.close_button = QPushButton(_icon("close"), "")
         self.close_button.setFixedSize(button_size, button_height)
         self.close_button.setFlat(True)
         self.close_button.clicked.connect(self.on_close)
@@ -1447,28 +1585,12 @@ class CustomWindowFrame(QWidget):
         self.title_bar_layout.addWidget(self.minimize_button)
         self.title_bar_layout.addWidget(self.maximize_button)
         self.title_bar_layout.addWidget(self.close_button)
+        # The only title bar children a press must not drag through; fixed for the frame's life
+        self._title_bar_buttons = (self.minimize_button, self.maximize_button, self.close_button)
         
         # Style title bar and buttons
         self.title_bar.setFixedHeight(30)
-        self.title_bar.setStyleSheet("""
-            QWidget {
-                background-color: #383838;
-                color: #cccccc;
-            }
-            QPushButton {
-                border: none;
-                border-radius: 0px;
-                background-color: #383838;
-                color: #cccccc;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            QPushButton#close_button:hover {
-                background-color: #e81123;
-                color: white;
-            }
-        """)
+        self.title_bar.setStyleSheet(_WINDOWFRAME_TITLE_BAR_QSS)
         self.close_button.setObjectName("close_button")
         
         # Content area
@@ -1482,12 +1604,7 @@ class CustomWindowFrame(QWidget):
         self.layout.addWidget(self.content_area)
         
         # Border styling
-        self.setStyleSheet("""
-            CustomWindowFrame {
-                border: 1px solid #1e1e1e;
-                background-color: #252526;
-            }
-        """)
+        self.setStyleSheet(_WINDOWFRAME_QSS)
     
     def setTitle(self, title: str):
         """Set the window title."""
@@ -1505,10 +1622,10 @@ class CustomWindowFrame(QWidget):
         """Maximize or restore the window."""
         if self.parent.isMaximized():
             self.parent.showNormal()
-            self.maximize_button.setText("□")
+            self.maximize_button.setIcon(_icon("maximize"))
         else:
             self.parent.showMaximized()
-            self.maximize_button.setText("❐")
+            self.maximize_button.setIcon(_icon("restore"))
     
     def on_close(self):
         """Close the window."""
@@ -1520,39 +1637,20 @@ class CustomWindowFrame(QWidget):
         # when dragging the application's custom title bar.
         # If CustomWindowFrame were used as a standalone, non-frameless window's content,
         # then this might be relevant, but not for the main app window dragging.
-        if event.button() == Qt.LeftButton and self.title_bar.geometry().contains(event.pos()):
+        pos = event.position().toPoint()
+        if event.button() == Qt.LeftButton and self.title_bar.geometry().contains(pos):
             # Check if the click is on a button within the title bar
-            for child in self.title_bar.findChildren(QPushButton):
-                if child.geometry().contains(event.pos() - self.title_bar.pos()): # Adjust pos to child's coordinate system
+            title_bar_pos = pos - self.title_bar.pos() # Into the buttons' parent coordinates, once
+            for child in self._title_bar_buttons:
+                if child.isVisible() and child.geometry().contains(title_bar_pos):
                     # Let the button handle its own press
                     return super().mousePressEvent(event)
             
-            # If not on a button, and if on Windows, try to initiate system drag
-            if sys.platform == "win32":
-                try:
-                    # Ensure ReleaseCapture and SendMessage are available (might need to be class members or initialized)
-                    # For this example, assuming they are initialized in ViewMeshApp and accessible
-                    # Or, more directly:
-                    ReleaseCapture = ctypes.windll.user32.ReleaseCapture
-                    SendMessage = ctypes.windll.user32.SendMessageW
-                    
-                    ReleaseCapture()
-                    # WM_NCLBUTTONDOWN = 0x00A1, HTCAPTION = 2
-                    # Important: SendMessage should target the TOP-LEVEL window (self.parent in this context if parent is ViewMeshApp)
-                    SendMessage(int(self.parent.winId()), 0x00A1, 2, 0)
-                    event.accept()
-                    return # Drag initiated by OS
-                except AttributeError as e:
-                    print(f"WinAPI functions not available or parent not set up for CustomWindowFrame drag: {e}")
-                except Exception as e:
-                    print(f"Error in CustomWindowFrame drag API: {e}")
-            
-            # Fallback or non-Windows: Delegate to parent if possible, or handle locally if this frame is meant to be independently draggable.
-            # For the main application, ViewMeshApp should handle this.
-            # If this CustomWindowFrame is truly independent and needs its own dragging:
-            # self.is_dragging = True
-            # self.drag_position = event.globalPos() - self.parent.frameGeometry().topLeft()
-            # event.accept()
+            # If not on a button, hand the move of the top-level window to the window system
+            handle = self.window().windowHandle()
+            if handle is not None and handle.startSystemMove():
+                event.accept()
+                return # Drag driven by the OS, no per-move work here
         super().mousePressEvent(event) # Pass on if not handled
         
 
@@ -1584,81 +1682,198 @@ class AppCustomizer(ABC):
         toggle_fullscreen_action.triggered.connect(app_window.toggle_fullscreen)
         toggle_fullscreen_action.setCheckable(True)
         # Set initial check state (important if menu is created after window is shown/state restored)
-        # It might be better for ViewMeshApp.toggle_fullscreen to manage the action's check state if passed.
-        # For now, let's assume it's set here. The action itself should be updated by toggle_fullscreen.
-        # The ViewMeshApp.toggle_fullscreen already updates a found action. 
-        # For robustness, the action could be passed to toggle_fullscreen or toggle_fullscreen finds it by text.
-        # For now, this is okay, but ViewMeshApp.toggle_fullscreen needs to reliably find this action if it's to update its state.
         toggle_fullscreen_action.setChecked(app_window.isFullScreen()) 
+        # StudioMainWindow.toggle_fullscreen keeps the check state in sync through this reference
+        app_window.toggle_fullscreen_action = toggle_fullscreen_action
         return toggle_fullscreen_action
     
+# The main window's one stylesheet. Rules are scoped by object name to the widget they
+# style, so Qt polishes the window tree against a single sheet instead of one per widget.
+_MAIN_WINDOW_QSS = """
+    QMainWindow {
+        border: 1px solid #252526;
+        background-color: #1e1e1e;
+    }
+
+    /* Title bar */
+    QLabel#title_bar_icon_label {
+        color: #cccccc;
+        padding-left: 5px;
+    }
+    QMenuBar#title_bar_menu_bar_widget {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: none;
+        padding: 0px;  /* No padding */
+    }
+    QMenuBar#title_bar_menu_bar_widget::item {
+        background-color: transparent;
+        padding: 2px 8px;  /* Minimal padding */
+        margin: 0px;
+        color: #cccccc;
+    }
+    QMenuBar#title_bar_menu_bar_widget::item:selected {
+        background-color: #094771;
+        color: #ffffff;
+    }
+    QPushButton#minimize_button, QPushButton#maximize_button, QPushButton#close_button {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        border: none;
+        border-radius: 0px;
+        padding: 0px;
+        font-size: 10pt;
+    }
+    QPushButton#minimize_button:hover, QPushButton#maximize_button:hover {
+        background-color: #505050;
+    }
+    QPushButton#close_button:hover {
+        background-color: #e81123;
+        color: white;
+    }
+
+    /* Explorer */
+    QWidget#explorer_container, QWidget#explorer_container QWidget {
+        border: none;
+        background-color: #252526;
+        color: #ffffff;
+    }
+    QWidget#explorer_container QTreeView {
+        border: none;
+        background-color: #252526;
+        color: #cccccc;
+        alternate-background-color: #252526;  /* Make both alternating colors the same */
+    }
+    QWidget#explorer_container QTreeView::item:selected {
+        background-color: #094771;
+        color: #ffffff;
+    }
+    QWidget#explorer_container QTreeView::item:hover:!selected {
+        background-color: #2a2d2e;
+    }
+    QToolBar#explorer_toolbar {
+        background-color: #252526;
+        border: none;
+        padding: 2px;
+        spacing: 2px;
+    }
+    QToolBar#explorer_toolbar QToolButton {
+        background-color: transparent;
+        border: none;
+        border-radius: 3px;
+        padding: 6px;
+        margin: 0px;
+        color: #cccccc;
+    }
+    QToolBar#explorer_toolbar QToolButton:hover {
+        background-color: #37373d;
+        color: #ffffff;
+    }
+
+    /* Editor area */
+    QSplitter#main_splitter::handle {
+        background-color: #353535;
+        border: 1px solid #474747;
+    }
+    QSplitter#main_splitter::handle:hover {
+        background-color: #404040;
+    }
+    QSplitter#main_splitter::handle:pressed {
+        background-color: #505050;
+    }
+    QTabWidget#main_tab_widget::pane {
+        border: none;
+        background-color: #1e1e1e;
+    }
+    QTabWidget#main_tab_widget QTabBar::tab {
+        background-color: #2d2d2d;
+        color: #cccccc;
+        border: none;
+        padding: 6px 12px;
+        margin: 0px 1px 0px 0px;
+    }
+    QTabWidget#main_tab_widget QTabBar::tab:selected {
+        background-color: #1e1e1e;
+        border-top: 1px solid #007acc;
+    }
+
+    /* Status bar */
+    QStatusBar#status_bar {
+        background-color: #007acc;
+        color: white;
+        padding: 0px;
+        font-size: 9pt;
+    }
+    QStatusBar#status_bar QLabel { /* Default for labels within status bar if not overridden */
+        padding: 3px 5px;
+        margin: 0px;
+        background-color: transparent; /* Ensure transparency against blue bar */
+        color: white; /* Ensure white text */
+    }
+    QStatusBar#status_bar QLabel#encoding_label,
+    QStatusBar#status_bar QLabel#line_col_label,
+    QStatusBar#status_bar QLabel#indent_label {
+        padding: 3px 8px;
+        border-left: 1px solid rgba(255, 255, 255, 0.3);
+    }
+    QStatusBar#status_bar QLabel#indent_label {
+        margin-right: 3px;
+    }
+    QStatusBar#status_bar QLabel#status_message {
+        padding: 3px 8px;
+    }
+"""
+
+# (text, shortcut, StudioMainWindow slot name); None marks a separator
+_FILE_MENU_SPEC = [
+    ("&New", QKeySequence.New, "on_new_file"),
+    ("&Open File...", QKeySequence.Open, "on_open_file"),
+    ("Open &Folder...", None, "on_open_folder"),
+    None,
+    ("&Save", QKeySequence.Save, "on_save"),
+    ("Save &As...", QKeySequence.SaveAs, "on_save_as"),
+    None,
+    ("E&xit", QKeySequence.Quit, "close"),
+]
+
+# (text, shortcut) for the placeholder Edit menu actions; None marks a separator
+_EDIT_MENU_SPEC = [
+    ("&Undo", QKeySequence.Undo),
+    ("&Redo", QKeySequence.Redo),
+    None,
+    ("Cu&t", QKeySequence.Cut),
+    ("&Copy", QKeySequence.Copy),
+    ("&Paste", QKeySequence.Paste),
+]
+
 class DefaultAppCustomizer(AppCustomizer):
 
     def _populate_menus(self, menu_bar: QMenuBar, app_window: 'StudioMainWindow'):
         # File Menu
         file_menu = menu_bar.addMenu("&File")
-
-        new_action = QAction("&New", app_window)
-        new_action.setShortcut(QKeySequence.New)
-        new_action.triggered.connect(app_window.on_new_file)
-        file_menu.addAction(new_action)
-
-        open_file_action = QAction("&Open File...", app_window)
-        open_file_action.setShortcut(QKeySequence.Open)
-        open_file_action.triggered.connect(app_window.on_open_file)
-        file_menu.addAction(open_file_action)
-
-        open_folder_action = QAction("Open &Folder...", app_window)
-        open_folder_action.triggered.connect(app_window.on_open_folder)
-        file_menu.addAction(open_folder_action)
-
-        file_menu.addSeparator()
-
-        save_action = QAction("&Save", app_window)
-        save_action.setShortcut(QKeySequence.Save)
-        save_action.triggered.connect(app_window.on_save)
-        file_menu.addAction(save_action)
-
-        save_as_action = QAction("Save &As...", app_window)
-        save_as_action.setShortcut(QKeySequence.SaveAs)
-        save_as_action.triggered.connect(app_window.on_save_as)
-        file_menu.addAction(save_as_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("E&xit", app_window)
-        exit_action.setShortcut(QKeySequence.Quit)
-        exit_action.triggered.connect(app_window.close) 
-        file_menu.addAction(exit_action)
+        for spec in _FILE_MENU_SPEC:
+            if spec is None:
+                file_menu.addSeparator()
+                continue
+            text, shortcut, slot = spec
+            action = QAction(text, app_window)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(app_window, slot))
+            file_menu.addAction(action)
 
         # Edit Menu (placeholders for now)
         edit_menu = menu_bar.addMenu("&Edit")
-        undo_action = QAction("&Undo", app_window)
-        undo_action.setShortcut(QKeySequence.Undo)
-        undo_action.triggered.connect(lambda: app_window.showMessage("Undo not implemented"))
-        edit_menu.addAction(undo_action)
-        # ... (add other Edit menu items similarly) ...
-        redo_action = QAction("&Redo", app_window)
-        redo_action.setShortcut(QKeySequence.Redo)
-        redo_action.triggered.connect(lambda: app_window.showMessage("Redo not implemented"))
-        edit_menu.addAction(redo_action)
-
-        edit_menu.addSeparator()
-
-        cut_action = QAction("Cu&t", app_window)
-        cut_action.setShortcut(QKeySequence.Cut)
-        cut_action.triggered.connect(lambda: app_window.showMessage("Cut not implemented"))
-        edit_menu.addAction(cut_action)
-
-        copy_action = QAction("&Copy", app_window)
-        copy_action.setShortcut(QKeySequence.Copy)
-        copy_action.triggered.connect(lambda: app_window.showMessage("Copy not implemented"))
-        edit_menu.addAction(copy_action)
-
-        paste_action = QAction("&Paste", app_window)
-        paste_action.setShortcut(QKeySequence.Paste)
-        paste_action.triggered.connect(lambda: app_window.showMessage("Paste not implemented"))
-        edit_menu.addAction(paste_action)
+        for spec in _EDIT_MENU_SPEC:
+            if spec is None:
+                edit_menu.addSeparator()
+                continue
+            text, shortcut = spec
+            action = QAction(text, app_window)
+            action.setShortcut(shortcut)
+            message = f"{text.replace('&', '')} not implemented"
+            action.triggered.connect(lambda checked=False, message=message: app_window.showMessage(message))
+            edit_menu.addAction(action)
 
         # View Menu
         view_menu = menu_bar.addMenu("&View")
@@ -1668,15 +1883,15 @@ class DefaultAppCustomizer(AppCustomizer):
         # toggle_explorer_action.setChecked(app_window.explorer_container.isVisible()) # Handled by connection
         toggle_explorer_action.triggered.connect(app_window.toggle_explorer)
         view_menu.addAction(toggle_explorer_action)
-        if hasattr(app_window, 'explorer_container'): # Connect only if explorer_container exists
+        if app_window.explorer_container is not None: # Connect only if explorer_container exists
             # Note: QWidget doesn't have visibilityChanged signal like QDockWidget, so we'll set initial state
-            toggle_explorer_action.setChecked(app_window.explorer_container.isVisible())
+            toggle_explorer_action.setChecked(not app_window.explorer_container.isHidden())
 
         toggle_welcome_action = QAction("Show &Welcome", app_window)
         toggle_welcome_action.setCheckable(True)
-        if hasattr(app_window, 'welcome_dock'): # Check before accessing isVisible and connecting
+        if app_window.welcome_dock is not None: # Check before accessing isVisible and connecting
             # toggle_welcome_action.setChecked(app_window.welcome_dock.isVisible()) # Handled by connection
-            app_window.welcome_dock.visibilityChanged.connect(toggle_welcome_action.setChecked)
+            app_window.welcome_dock.visibilityChanged.connect(app_window.guard_dock_visibility(toggle_welcome_action.setChecked))
         else: # If no welcome_dock, disable this menu item perhaps, or set default checked state false
             toggle_welcome_action.setChecked(False)
             toggle_welcome_action.setEnabled(False)
@@ -1692,28 +1907,33 @@ class DefaultAppCustomizer(AppCustomizer):
 
         # Help Menu
         help_menu = menu_bar.addMenu("&Help")
+        # No shortcuts in here, so the actions can wait until the menu is first opened
+        help_menu.aboutToShow.connect(
+            functools.partial(self._populate_help_menu, help_menu, app_window), Qt.SingleShotConnection)
+
+    def _populate_help_menu(self, help_menu: QMenu, app_window: 'StudioMainWindow'):
         about_action = QAction("&About ViewMesh", app_window)
         about_action.triggered.connect(app_window.on_about)
         help_menu.addAction(about_action)
 
+    def _populate_welcome(self, placeholder_layout: QVBoxLayout):
+        """Fill in the welcome page content, deferred until after the window's first paint."""
+        # VS Code-like placeholder content
+        welcome_label = QLabel("Welcome to ViewMesh")
+        welcome_label.setFont(_bold_font())
+        welcome_label.setAlignment(Qt.AlignCenter)
+        welcome_label.setStyleSheet("color: #cccccc; margin-top: 40px; background-color: transparent;")
+        
+        placeholder_layout.insertWidget(0, welcome_label) # Above the stretch
+
     def customise(self, app: 'StudioMainWindow'):
         # Add a placeholder tab for now - styled like VS Code welcome page
         placeholder = QWidget()
         placeholder.setStyleSheet("background-color: #1e1e1e;")  # Set dark background color
         placeholder_layout = QVBoxLayout(placeholder)
         placeholder_layout.setContentsMargins(0, 0, 0, 0)  # Remove margins
-        
-        # VS Code-like placeholder content
-        welcome_label = QLabel("Welcome to ViewMesh")
-        welcome_font = welcome_label.font()
-        # welcome_font.setPointSize(14) # Allow inheritance or set relative
-        welcome_font.setBold(True)
-        welcome_label.setFont(welcome_font)
-        welcome_label.setAlignment(Qt.AlignCenter)
-        welcome_label.setStyleSheet("color: #cccccc; margin-top: 40px; background-color: transparent;")
-        
-        placeholder_layout.addWidget(welcome_label)
         placeholder_layout.addStretch(1)
+        QTimer.singleShot(0, placeholder, lambda: self._populate_welcome(placeholder_layout))
         
         # Add a placeholder tab for now - styled like VS Code welcome page
         placeholder1 = QWidget()
@@ -1730,43 +1950,106 @@ class DefaultAppCustomizer(AppCustomizer):
         app.add_tab("Editor 2", placeholder2)
         app.add_tab("Welcome", placeholder)
 
-        # Setup status bar widgets (copied from previous state, ensure it's correct)
+        # Setup status bar widgets; styled by _MAIN_WINDOW_QSS through their object names
         encoding_label = QLabel("UTF-8")
         encoding_label.setObjectName("encoding_label")
-        encoding_label.setStyleSheet("padding: 3px 8px; border-left: 1px solid rgba(255, 255, 255, 0.3); background-color: transparent; color: white;")
         app.add_status_bar_permanent_widget(encoding_label)
         
         line_col_label = QLabel("Ln 1, Col 1")
         line_col_label.setObjectName("line_col_label")
-        line_col_label.setStyleSheet("padding: 3px 8px; border-left: 1px solid rgba(255, 255, 255, 0.3); background-color: transparent; color: white;")
         app.add_status_bar_permanent_widget(line_col_label)
         
         indent_label = QLabel("Spaces: 4")
         indent_label.setObjectName("indent_label")
-        indent_label.setStyleSheet("padding: 3px 8px 3px 8px; margin-right: 3px; border-left: 1px solid rgba(255, 255, 255, 0.3); background-color: transparent; color: white;")
         app.add_status_bar_permanent_widget(indent_label)
         
         status_message = QLabel("Ready")
         status_message.setObjectName("status_message")
-        status_message.setStyleSheet("padding: 3px 8px; background-color: transparent; color: white;")
         app.set_main_status_message_label(status_message)
         app.add_status_bar_widget(status_message)
 
         # Populate menus
-        if hasattr(app, 'menu_bar'): # Ensure menu_bar exists on app
+        if app.menu_bar is not None: # Ensure menu_bar exists on app
             self._populate_menus(app.menu_bar, app)
             # After populating menus, update the title bar height to reflect the menu bar's content
-            if hasattr(app, '_update_title_bar_height') and callable(app._update_title_bar_height):
-                app._update_title_bar_height()
+            app._update_title_bar_height()
         else:
-            print("Warning: StudioMainWindow instance does not have 'menu_bar' attribute. Menus not populated.")
+            log.warning("StudioMainWindow instance does not have 'menu_bar' attribute. Menus not populated.")
+
+class TitleBarMenuBar(QMenuBar):
+    """Menu bar embedded in the custom title bar.
+
+    Left presses that miss every action are ignored so they propagate up to the
+    main window, which treats them as a title bar drag.
+    """
+    def mousePressEvent(self, event: QMouseEvent):
+        if event.button() == Qt.LeftButton and self.actionAt(event.position().toPoint()) is None:
+            event.ignore()
+            return
+        super().mousePressEvent(event)
+
+class _ContextMoveFilter(QObject):
+    """Application event filter that ends a context-menu move on the next mouse press.
+
+    Installed only for the duration of the move, so no events are routed through
+    Python the rest of the time.
+    """
+    def __init__(self, on_press, parent=None):
+        super().__init__(parent)
+        self._on_press = on_press
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.MouseButtonPress:
+            self._on_press()
+            return True # Swallow the click that ends the move
+        return False
+
+# Dynamic property naming how a title bar child takes part in drag/double-click hit
+# testing: "button" and "menubar" block, anything else (or unset) is "transparent"
+_HIT_KIND_PROPERTY = "vm_hit_kind"
+
+class TitleBarWidget(QWidget):
+    """Container for the main window's custom title bar.
+
+    Emits children_moved whenever its children may have been added, removed or
+    relaid out, so the main window can keep a cached hit-test map of them.
+    """
+    children_moved = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_StyledBackground, True) # Paint QSS backgrounds like a plain QWidget
+
+    def childEvent(self, event):
+        super().childEvent(event)
+        if event.type() in (QEvent.ChildAdded, QEvent.ChildRemoved):
+            self.children_moved.emit()
+
+    def resizeEvent(self, event: QResizeEvent):
+        super().resizeEvent(event)
+        self.children_moved.emit()
 
 class StudioMainWindow(QMainWindow):
     """A QMainWindow implementing a versatile studio-like user interface."""
+    # Set by setup_ui(); optional panels stay None when not created
+    menu_bar: Optional[QMenuBar] = None
+    status_bar: Optional[QStatusBar] = None
+    # Set by AppCustomizer.create_toggle_fullscreen_action()
+    toggle_fullscreen_action: Optional[QAction] = None
+    # Built on the first title bar right click by _build_title_bar_context_menu()
+    _title_bar_context_menu: Optional[QMenu] = None
+    explorer_container: Optional[QWidget] = None
+    welcome_dock: Optional[QDockWidget] = None
+    # Created on the first non-maximized resize; unused while maximized
+    edge_handles: Optional[List[EdgeResizeHandle]] = None
+    # Built after the first paint by _create_explorer_async(); a placeholder holds its slot
+    explorer: Optional[FileExplorerWidget] = None
 
     def __init__(self, config: AppConfig):
         super().__init__(None, Qt.FramelessWindowHint)  # Make window frameless
         self.config = config
+        # Warm the explorer's directory listing while the UI is built
+        QThreadPool.globalInstance().start(lambda: warm_directory(config.initial_dir))
         self.setObjectName("ViewMeshAppMainWindow") 
         self.was_maximized_before_fullscreen = False 
         self.resize_handle_thickness = 5 
@@ -1778,17 +2061,51 @@ class StudioMainWindow(QMainWindow):
         self.is_context_menu_moving = False
         self.context_menu_drag_start_position = None
         self.context_menu_window_start_position = None
+        self._last_ctx_move_pos: Optional[QPoint] = None # Cursor position of the last applied move
+        self._ctx_move_filter: Optional[_ContextMoveFilter] = None # Installed on the app only during a move
+
+        # True while minimized; dock visibility signals are then side effects of the
+        # minimize, not user intent, and must not touch checked actions or layout
+        self._suppress_dock_visibility = False
+
+        # (widget, "button" | "menubar", x0, y0, x1, y1) for every title bar control,
+        # with the half-open rect in title bar coordinates; rebuilt on the
+        # first press after the title bar changes
+        self._title_bar_hit_cache: List[Tuple[QWidget, str, int, int, int, int]] = []
+        self._title_bar_hit_cache_dirty = True
 
         # Timer for context menu initiated move
         self.context_move_timer = QTimer(self)
         self.context_move_timer.setInterval(16) # Roughly 60 FPS
         self.context_move_timer.timeout.connect(self._perform_context_menu_move)
 
+        # Manual (fallback) title bar drags move the window at most once per frame
+        self._pending_move_pos: Optional[QPoint] = None
+        self._drag_throttle = QTimer(self)
+        self._drag_throttle.setSingleShot(True)
+        self._drag_throttle.setInterval(_DRAG_UPDATE_INTERVAL_MS)
+        self._drag_throttle.timeout.connect(self._apply_pending_move)
+
+        # Title bar height is recomputed once per event loop pass, and only when the
+        # menu bar font or contents changed since the last computation
+        self._title_bar_height_dirty_timer = QTimer(self)
+        self._title_bar_height_dirty_timer.setSingleShot(True)
+        self._title_bar_height_dirty_timer.setInterval(0)
+        self._title_bar_height_dirty_timer.timeout.connect(self._do_update_title_bar_height)
+        self._cached_menu_font_key: Optional[Tuple[str, int, int]] = None
+        self._cached_title_bar_height: Optional[int] = None
+
+        # Debounce timer for window state saves; restarted by every save_window_state() call
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(1000)
+        self._save_timer.timeout.connect(self._do_save_window_state)
+
         # Font size adjustment - Initialize from saved config
         self.global_font_size_adjust = self.config.settings.global_font_size_adjust
-        _app_font = QApplication.font() 
-        self.initial_app_font_point_size = _app_font.pointSize()
-        self.initial_app_font_family = _app_font.family()
+        initial_font = _app_font()
+        self.initial_app_font_point_size = initial_font.pointSize()
+        self.initial_app_font_family = initial_font.family()
         
         # Set window title
         self.setWindowTitle(config.app_name)
@@ -1796,38 +2113,40 @@ class StudioMainWindow(QMainWindow):
         # Set up async event loop integration
         self.setup_async_loop()
         
-        # Set up UI (event filter for title_bar will be installed here)
-        self.setup_ui()
-        
-        # Restore window state using the manager
-        # self.restore_window_state() # Old method call
-        self.setWindowOpacity(0.0) # Prevent flicker
-        self.show() # Show before moving to ensure Qt knows it exists
-        self.geometry_manager.restore_geometry()
-        QApplication.processEvents() # Allow Qt to process move/resize
-        self.setWindowOpacity(1.0)
+        # Set up UI and restore state with painting frozen so the whole span costs a
+        # single layout pass once updates are re-enabled (setup_ui disables them)
+        self.blockSignals(True)
+        try:
+            self.setup_ui()
+            
+            # Restore window state using the manager. The window is shown off screen so Qt
+            # lays it out and knows it exists while it is moved, without a flicker
+            self.setAttribute(Qt.WA_DontShowOnScreen, True)
+            self.show()
+            self.geometry_manager.restore_geometry()
 
-        # Restore maximized state (after geometry is set)
-        if self.config.settings.is_maximized:
-            self.showMaximized()
-        
-        # Restore dock widget sizes (specific to ViewMeshApp) - Remove fixed width constraints
-        # self.explorer_container.setMinimumWidth(self.config.settings.explorer_width)  # Remove fixed constraints
-        # self.explorer_container.setMaximumWidth(self.config.settings.explorer_width)  # Remove fixed constraints
-        
-        # Restore complete window state if available (specific to ViewMeshApp)
-        if self.config.settings.state:
-            self.restoreState(self.config.settings.state)
-        
-        # Restore initial directory (specific to ViewMeshApp)
-        if hasattr(self.explorer, 'initial_dir'): # Check if explorer exists
-            self.explorer.initial_dir = self.config.initial_dir
-        
-        # Apply initial font size adjustment if any (AFTER UI is set up and state restored)
-        if self.global_font_size_adjust != 0:
-            self._apply_global_font_change()
-        
-        self._create_resize_handles()
+            # Restore maximized state (after geometry is set)
+            if self.config.settings.is_maximized:
+                self.showMaximized()
+            
+            # Restore complete window state if available (specific to ViewMeshApp)
+            if self.config.settings.state:
+                self.restoreState(self.config.settings.state)
+            
+            # Restore initial directory (specific to ViewMeshApp)
+            if self.explorer is not None:
+                self.explorer.initial_dir = self.config.initial_dir
+            
+            # Apply initial font size adjustment if any (AFTER UI is set up and state restored)
+            if self.global_font_size_adjust != 0:
+                self._apply_global_font_change()
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+            # Back to a normal hidden window; the caller's show() puts it on screen once
+            self.setAttribute(Qt.WA_DontShowOnScreen, False)
+            self.hide()
 
         # Set resize cursor for window edges (now handled by EdgeResizeHandle)
         # self.setMouseTracking(True)
@@ -1837,32 +2156,40 @@ class StudioMainWindow(QMainWindow):
         self.drag_start_position = None
         self.window_start_position = None
         
-        if sys.platform == "win32":
-            try:
-                self.user32 = ctypes.windll.user32
-                self.ReleaseCapture = self.user32.ReleaseCapture
-                self.SendMessage = self.user32.SendMessageW
-                self.PostMessage = self.user32.PostMessageW # Load PostMessageW
-                # print("Windows API functions for window management initialized (SendMessage, PostMessage)")
-            except Exception as e:
-                print(f"Error initializing Windows API functions: {e}")
-                self.ReleaseCapture = None
-                self.SendMessage = None
-                self.PostMessage = None # Ensure it's None on error
-        else:
-            self.ReleaseCapture = None
-            self.SendMessage = None
-            self.PostMessage = None # Ensure it's None on non-Windows
-        
-        self.installEventFilter(self) # Install event filter for ViewMeshApp itself
-        # print(f"Event filter installed on {self.objectName()} in __init__") # DEBUG PRINT
+        # Win32 window management functions, resolved on first drag/resize by _ensure_win32_api
+        self._win32_api_loaded = False
+        self.ReleaseCapture = None
+        self.SendMessage = None
+        self.PostMessage = None
         
+    def _ensure_win32_api(self) -> bool:
+        """Resolve the user32 functions on first use; returns True if they are available."""
+        if not self._win32_api_loaded:
+            self._win32_api_loaded = True
+            if sys.platform == "win32":
+                try:
+                    self.user32 = ctypes.windll.user32
+                    self.ReleaseCapture = self.user32.ReleaseCapture
+                    self.SendMessage = self.user32.SendMessageW
+                    self.PostMessage = self.user32.PostMessageW # Load PostMessageW
+                    # print("Windows API functions for window management initialized (SendMessage, PostMessage)")
+                except Exception as e:
+                    log.warning("Error initializing Windows API functions: %s", e)
+                    self.ReleaseCapture = None
+                    self.SendMessage = None
+                    self.PostMessage = None # Ensure it's None on error
+        return self.SendMessage is not None and self.ReleaseCapture is not None
+
     def add_tab(self, tab_name: str, widget: QWidget):
         self.tab_widget.addTab(widget, tab_name)
         self.tab_widget.setCurrentWidget(widget)
     
     def setup_ui(self):
         """Set up the main UI components."""
+        self.setUpdatesEnabled(False) # Re-enabled by __init__ once state is restored
+        # Styles every child below, so it is set once before any of them exist
+        self.setStyleSheet(_MAIN_WINDOW_QSS)
+
         # Main container widget
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -1873,10 +2200,9 @@ class StudioMainWindow(QMainWindow):
         self.main_layout.setSpacing(0)
         
         # Create title bar with integrated menu and window controls
-        self.title_bar = QWidget()
+        self.title_bar = TitleBarWidget()
         self.title_bar.setObjectName("custom_title_bar_widget")
-        self.title_bar.installEventFilter(self)
-        # print(f"Event filter installed on {self.title_bar.objectName()} in setup_ui")
+        self.title_bar.children_moved.connect(self._invalidate_title_bar_hit_cache)
         # self.title_bar.setFixedHeight(24) # Allow dynamic height based on content
         self.title_bar.setContextMenuPolicy(Qt.CustomContextMenu)
         self.title_bar.customContextMenuRequested.connect(self.show_title_bar_context_menu) # Added this line back
@@ -1886,37 +2212,17 @@ class StudioMainWindow(QMainWindow):
         
         # App icon
         self.icon_label = QLabel()
-        self.icon_label.setText("🪟")  # Unicode symbol for window
+        self.icon_label.setPixmap(_icon("window").pixmap(16, 16))
         self.icon_label.setFixedSize(18, 18)  # Smaller icon
         self.icon_label.setAlignment(Qt.AlignCenter)
-        self.icon_label.setStyleSheet("color: #cccccc; padding-left: 5px;")
+        self.icon_label.setObjectName("title_bar_icon_label")
         self.title_bar_layout.addWidget(self.icon_label)
         self.title_bar_layout.addSpacing(3)
         
         # Create menu bar (will be added to title bar)
-        self.menu_bar = QMenuBar()
+        self.menu_bar = TitleBarMenuBar()
         # self.menu_bar.setMaximumHeight(22) # Allow dynamic height based on font
         self.menu_bar.setObjectName("title_bar_menu_bar_widget")
-        self.menu_bar.installEventFilter(self)
-        # print(f"Event filter installed on {self.menu_bar.objectName()} in setup_ui")
-        self.menu_bar.setStyleSheet("""
-            QMenuBar {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: none;
-                padding: 0px;  /* No padding */
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 2px 8px;  /* Minimal padding */
-                margin: 0px;
-                color: #cccccc;
-            }
-            QMenuBar::item:selected {
-                background-color: #094771;
-                color: #ffffff;
-            }
-        """)
         
         # Add menu bar to title bar (takes up stretch space)
         self.title_bar_layout.addWidget(self.menu_bar, 1)
@@ -1926,45 +2232,39 @@ class StudioMainWindow(QMainWindow):
         button_height = 20  # Height reduced further
         
         # Minimize button
-        self.minimize_button = QPushButton("─")
+        self.minimize_button = QPushButton(_icon("minimize"), "")
         self.minimize_button.setFixedSize(button_size, button_height)
         self.minimize_button.setFlat(True)
         self.minimize_button.clicked.connect(self.showMinimized)
         
         # Maximize/restore button
-        self.maximize_button = QPushButton("□")
+        self.maximize_button = QPushButton(_icon("maximize"), "")
         self.maximize_button.setFixedSize(button_size, button_height)
         self.maximize_button.setFlat(True)
         self.maximize_button.clicked.connect(self.toggle_maximize)
         
         # Close button
-        self.close_button = QPushButton("✕")
+        self.close_button = QPushButton(_icon("close"), "")
         self.close_button.setFixedSize(button_size, button_height)
         self.close_button.setFlat(True)
         self.close_button.clicked.connect(self.close)
         
-        # Style window control buttons
-        control_buttons_style = """
-            QPushButton {
-                background-color: #1e1e1e;
-                color: #cccccc;
-                border: none;
-                border-radius: 0px;
-                padding: 0px;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            #close_button:hover {
-                background-color: #e81123;
-                color: white;
-            }
-        """
-        self.minimize_button.setStyleSheet(control_buttons_style)
-        self.maximize_button.setStyleSheet(control_buttons_style)
-        self.close_button.setStyleSheet(control_buttons_style)
+        # Window control buttons are styled by _MAIN_WINDOW_QSS through these names
+        self.minimize_button.setObjectName("minimize_button")
+        self.maximize_button.setObjectName("maximize_button")
         self.close_button.setObjectName("close_button")
+
+        # The window and the menu bar paint a solid background over their whole rect, so Qt
+        # can skip painting whatever lies behind them. The title bar is left out: its gaps
+        # between children show the central widget's background.
+        for opaque_widget in (self, self.menu_bar):
+            opaque_widget.setAttribute(Qt.WA_OpaquePaintEvent, True)
+            opaque_widget.setAutoFillBackground(True)
+
+        # Title bar hit-test categories, read once into the hit cache (see _rebuild_title_bar_hit_cache)
+        for button in (self.minimize_button, self.maximize_button, self.close_button):
+            button.setProperty(_HIT_KIND_PROPERTY, "button")
+        self.menu_bar.setProperty(_HIT_KIND_PROPERTY, "menubar")
         
         # Add window control buttons to title bar
         self.title_bar_layout.addWidget(self.minimize_button)
@@ -1974,12 +2274,6 @@ class StudioMainWindow(QMainWindow):
         # Add title bar to main layout
         self.main_layout.addWidget(self.title_bar)
         
-        # Content layout below title bar
-        self.content_container = QWidget()
-        self.content_layout = QVBoxLayout(self.content_container)
-        self.content_layout.setContentsMargins(0, 0, 0, 0)
-        self.content_layout.setSpacing(0)
-        
         # Create a container for the explorer and its toolbar to ensure proper alignment
         self.left_panel = QWidget()
         self.left_panel_layout = QVBoxLayout(self.left_panel)
@@ -1992,49 +2286,30 @@ class StudioMainWindow(QMainWindow):
         self.explorer_toolbar.setMovable(False)
         self.explorer_toolbar.setIconSize(QSize(16, 16))
         self.explorer_toolbar.setToolButtonStyle(Qt.ToolButtonIconOnly)
-        self.explorer_toolbar.setStyleSheet("""
-            QToolBar {
-                background-color: #252526;
-                border: none;
-                padding: 2px;
-                spacing: 2px;
-            }
-            QToolButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 3px;
-                padding: 6px;
-                margin: 0px;
-                color: #cccccc;
-            }
-            QToolButton:hover {
-                background-color: #37373d;
-                color: #ffffff;
-            }
-        """)
         
         # Add explorer toolbar buttons
-        open_folder_action = QAction("📂", self)
+        open_folder_action = QAction(_icon("open_folder"), "Open Folder", self)
         open_folder_action.setToolTip("Open Folder")
         open_folder_action.triggered.connect(self.on_open_folder)
-        self.explorer_toolbar.addAction(open_folder_action)
         
-        refresh_action = QAction("🔄", self)
+        refresh_action = QAction(_icon("refresh"), "Refresh Explorer", self)
         refresh_action.setToolTip("Refresh Explorer")
-        self.explorer_toolbar.addAction(refresh_action)
         
-        collapse_action = QAction("◀", self)
+        collapse_action = QAction(_icon("collapse"), "Collapse Folders", self)
         collapse_action.setToolTip("Collapse Folders")
-        self.explorer_toolbar.addAction(collapse_action)
+
+        self.explorer_toolbar.addActions([open_folder_action, refresh_action, collapse_action])
         
         # Add explorer toolbar to left panel
         self.left_panel_layout.addWidget(self.explorer_toolbar)
         
-        # Explorer panel with custom container
-        self.explorer = FileExplorerWidget(initial_dir=self.config.initial_dir)
+        # Explorer panel with custom container; the real explorer (and its file system
+        # scan) is created once the window is up, see _create_explorer_async
+        self._explorer_placeholder = QWidget()
         
         # Create a simple container for the explorer with custom title (instead of QDockWidget)
         self.explorer_container = QWidget()
+        self.explorer_container.setObjectName("explorer_container")
         self.explorer_container_layout = QVBoxLayout(self.explorer_container)
         self.explorer_container_layout.setContentsMargins(0, 0, 0, 0)
         self.explorer_container_layout.setSpacing(0)
@@ -2043,51 +2318,16 @@ class StudioMainWindow(QMainWindow):
         custom_title = CustomTitleBar("EXPLORER", self.explorer_container)  # VS Code uses uppercase
         self.explorer_container_layout.addWidget(custom_title)
         
-        # Add the actual explorer widget
-        self.explorer_container_layout.addWidget(self.explorer)
-        
-        # Style the explorer container to match VS Code's explorer panel
-        self.explorer_container.setStyleSheet("""
-            QWidget {
-                border: none;
-                background-color: #252526;
-                color: #ffffff;
-            }
-            QTreeView {
-                border: none;
-                background-color: #252526;
-                color: #cccccc;
-                alternate-background-color: #252526;  /* Make both alternating colors the same */
-            }
-            QTreeView::item:selected {
-                background-color: #094771;
-                color: #ffffff;
-            }
-            QTreeView::item:hover:!selected {
-                background-color: #2a2d2e;
-            }
-        """)
+        # Reserve the explorer widget's slot
+        self.explorer_container_layout.addWidget(self._explorer_placeholder)
         
         # Add explorer container to left panel
         self.left_panel_layout.addWidget(self.explorer_container)
         
         # Create splitter for sidebar and content
         self.splitter = QSplitter(Qt.Horizontal)
-        
-        # Style the splitter to make the handle visible and interactive like VS Code
+        self.splitter.setObjectName("main_splitter")
         self.splitter.setHandleWidth(1)  # Use original thin handle width
-        self.splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #353535;
-                border: 1px solid #474747;
-            }
-            QSplitter::handle:hover {
-                background-color: #404040;
-            }
-            QSplitter::handle:pressed {
-                background-color: #505050;
-            }
-        """)
         
         # Add left panel to splitter
         self.splitter.addWidget(self.left_panel)
@@ -2097,36 +2337,11 @@ class StudioMainWindow(QMainWindow):
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.setMovable(True)
         self.tab_widget.setDocumentMode(True)
+        self.tab_widget.setObjectName("main_tab_widget")
         
-
-        # Ensure tab widget has proper styling
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background-color: #1e1e1e;
-            }
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #cccccc;
-                border: none;
-                padding: 6px 12px;
-                margin: 0px 1px 0px 0px;
-            }
-            QTabBar::tab:selected {
-                background-color: #1e1e1e;
-                border-top: 1px solid #007acc;
-            }
-        """)
-        
-        # Main content
-        self.content_widget = QWidget()
-        self.content_layout_inner = QVBoxLayout(self.content_widget)
-        self.content_layout_inner.setContentsMargins(0, 0, 0, 0)
-        self.content_layout_inner.addWidget(self.tab_widget)
-        
-        # Add content widget to splitter
-        self.splitter.addWidget(self.content_widget)
-        self.content_layout.addWidget(self.splitter)
+        # The splitter and tabs go straight into their parents' layouts; wrapper widgets
+        # with single-child layouts would only add layout passes on every resize
+        self.splitter.addWidget(self.tab_widget)
         
         # Connect to splitter moved signal to adjust handle width based on visibility
         self.splitter.splitterMoved.connect(self._adjust_splitter_handle_width)
@@ -2137,28 +2352,27 @@ class StudioMainWindow(QMainWindow):
         # Status bar
         self.setup_status_bar()
         
-        # Add content to main layout
-        self.main_layout.addWidget(self.content_container)
+        # Add content below the title bar
+        self.main_layout.addWidget(self.splitter)
         
         # Setup menu items
         self.setup_menu_items()
         
-        # Apply dark theme to match VS Code
-        self.apply_vs_code_dark_theme()
-
         # Set initial title bar height correctly after all elements and styles are applied
         self._update_title_bar_height()
-        
-        # Set border for frameless window (already present, ensure it's after height calc)
-        self.setStyleSheet("""
-            QMainWindow {
-                border: 1px solid #252526;
-                background-color: #1e1e1e;
-            }
-        """)
+
+        # Defer the file explorer until after the first paint
+        QTimer.singleShot(0, self._create_explorer_async)
     
+    def _create_explorer_async(self):
+        """Swap the explorer placeholder for the real FileExplorerWidget."""
+        self.explorer = FileExplorerWidget(initial_dir=self.config.initial_dir)
+        self.explorer_container_layout.replaceWidget(self._explorer_placeholder, self.explorer)
+        self._explorer_placeholder.deleteLater()
+        self._explorer_placeholder = None
+
     def _create_resize_handles(self):
-        self.edge_handles = []
+        edge_handles = []
         positions = [
             HandlePosition.TOP_LEFT, HandlePosition.TOP, HandlePosition.TOP_RIGHT,
             HandlePosition.LEFT, HandlePosition.RIGHT,
@@ -2166,15 +2380,42 @@ class StudioMainWindow(QMainWindow):
         ]
         for pos in positions:
             handle = EdgeResizeHandle(self, pos, self.resize_handle_thickness)
-            self.edge_handles.append(handle)
+            edge_handles.append(handle)
             handle.show() # Ensure they are visible
             handle.raise_() # Explicitly raise it after showing
             # print(f"[DEBUG _create_resize_handles] Created handle: {pos}, Visible: {handle.isVisible()}, Geom: {handle.geometry()}")
+        self.edge_handles = edge_handles
+
+    def _sync_edge_handle_visibility(self):
+        """Hide the edge handles while maximized or fullscreen, show them otherwise."""
+        if self.edge_handles is None:
+            return
+        resizable = not (self.isMaximized() or self.isFullScreen())
+        for handle in self.edge_handles:
+            handle.setVisible(resizable)
+            if resizable:
+                handle.raise_()
+
+    def changeEvent(self, event: QEvent):
+        if event.type() == QEvent.WindowStateChange:
+            self._suppress_dock_visibility = self.isMinimized()
+            self._sync_edge_handle_visibility()
+        super().changeEvent(event)
+
+    def guard_dock_visibility(self, slot):
+        """Wrap a dock visibilityChanged slot so it is skipped while the window is minimized."""
+        def guarded(visible: bool):
+            if not self._suppress_dock_visibility:
+                slot(visible)
+        return guarded
 
     def resizeEvent(self, event: QResizeEvent):
         """Handle window resize event to update handle geometries."""
         super().resizeEvent(event)
-        if hasattr(self, 'edge_handles'): # Ensure handles are created
+        if self.edge_handles is None:
+            if not (self.isMaximized() or self.isFullScreen()):
+                self._create_resize_handles()
+        else:
             for handle in self.edge_handles:
                 handle.update_geometry()
         
@@ -2182,14 +2423,20 @@ class StudioMainWindow(QMainWindow):
         self._update_title_bar_height()
 
         # Update highlight overlay geometry if inspector is open
-        if hasattr(self, 'inspector_window_instance') and self.inspector_window_instance and \
-           hasattr(self.inspector_window_instance, 'highlight_overlay') and self.inspector_window_instance.highlight_overlay:
+        if self.inspector_window_instance is not None and self.inspector_window_instance.highlight_overlay is not None:
             self.inspector_window_instance.highlight_overlay.update_geometry()
     
     def _update_title_bar_height(self):
+        """Schedule a title bar height update; repeated requests coalesce."""
+        self._title_bar_height_dirty_timer.start()
+
+    def _do_update_title_bar_height(self):
         """Calculates and sets the title bar height based on current menu bar font and content."""
         # Ensure menu_bar's font is current (it should be if app font is set)
         menu_bar_font = self.menu_bar.font()
+        font_key = (menu_bar_font.family(), menu_bar_font.pointSize(), len(self.menu_bar.actions()))
+        if font_key == self._cached_menu_font_key and self._cached_title_bar_height is not None:
+            return # Nothing that affects the height changed
         
         # Force style recomputation for menu_bar to update its sizeHint correctly
         self.menu_bar.style().unpolish(self.menu_bar)
@@ -2214,6 +2461,8 @@ class StudioMainWindow(QMainWindow):
         self.title_bar.setFixedHeight(calculated_title_bar_height)
         # print(f"[DEBUG _update_title_bar_height] self.title_bar.setFixedHeight({calculated_title_bar_height}) called.")
         self.title_bar.adjustSize() # Tell the title bar to adjust its size
+        self._cached_menu_font_key = font_key
+        self._cached_title_bar_height = calculated_title_bar_height
 
     def _apply_global_font_change(self):
         new_point_size = self.initial_app_font_point_size + self.global_font_size_adjust
@@ -2234,192 +2483,28 @@ class StudioMainWindow(QMainWindow):
             self.menu_bar.setFont(menu_bar_font_check)
             # print(f"[DEBUG] self.menu_bar font explicitly set to pointSize: {self.menu_bar.font().pointSize()} in _apply_global_font_change")
 
+        self._cached_menu_font_key = None # Font changed, force a full recomputation
         self._update_title_bar_height() # Call the new method to set heights
 
-        self.apply_vs_code_dark_theme() 
-        self.update() 
-        QApplication.processEvents() 
-        # print(f"[DEBUG] After processEvents, self.title_bar.height(): {self.title_bar.height()}")
-
-    def apply_vs_code_dark_theme(self):
-        """Apply VS Code dark theme styling to all widgets."""
-        # VS Code dark theme colors
-        dark_theme = {
-            'background': '#1e1e1e',
-            'foreground': '#cccccc',
-            'sidebar': '#252526',
-            'active_selection': '#094771',
-            'inactive_selection': '#37373d',
-            'toolbar': '#333333',
-            'tab_background': '#2d2d2d',
-            'tab_active': '#1e1e1e',
-            'input_background': '#3c3c3c',
-            'border': '#474747',
-            'status_bar': '#007acc'
-        }
-        
-        vs_code_style = f"""
-        /* Global styles */
-        QWidget {{
-            background-color: {dark_theme['background']};
-            color: {dark_theme['foreground']};
-        }}
-        
-        /* Menu styling */
-        QMenuBar {{
-            background-color: {dark_theme['background']};
-            color: {dark_theme['foreground']};
-            border-bottom: 1px solid {dark_theme['border']};
-        }}
-        
-        QMenuBar::item {{
-            background: transparent;
-            padding: 5px 10px;
-        }}
-        
-        QMenuBar::item:selected {{
-            background-color: {dark_theme['active_selection']};
-        }}
-        
-        QMenu {{
-            background-color: {dark_theme['sidebar']};
-            color: {dark_theme['foreground']};
-            border: 1px solid {dark_theme['border']};
-        }}
-        
-        QMenu::item {{
-            padding: 5px 20px 5px 20px;
-        }}
-        
-        QMenu::item:selected {{
-            background-color: {dark_theme['active_selection']};
-        }}
-        
-        /* Tree view styling */
-        QTreeView {{
-            background-color: {dark_theme['sidebar']};
-            color: {dark_theme['foreground']};
-            border: none;
-            alternate-background-color: {dark_theme['sidebar']};  /* Make alternating colors the same */
-        }}
-        
-        QTreeView::item {{
-            padding: 2px;
-        }}
-        
-        QTreeView::item:selected {{
-            background-color: {dark_theme['active_selection']};
-        }}
-        
-        /* Status bar styling */
-        QStatusBar {{
-            background-color: {dark_theme['status_bar']};
-            color: white;
-            border-top: 1px solid {dark_theme['border']};
-        }}
-        
-        /* Scroll bar styling */
-        QScrollBar:vertical {{
-            background-color: {dark_theme['background']};
-            width: 14px;
-            margin: 0px;
-        }}
-        
-        QScrollBar::handle:vertical {{
-            background-color: #5a5a5a;
-            min-height: 20px;
-            border-radius: 7px;
-            margin: 2px;
-        }}
-        
-        QScrollBar:horizontal {{
-            background-color: {dark_theme['background']};
-            height: 14px;
-            margin: 0px;
-        }}
-        
-        QScrollBar::handle:horizontal {{
-            background-color: #5a5a5a;
-            min-width: 20px;
-            border-radius: 7px;
-            margin: 2px;
-        }}
-        
-        /* Toolbar styling */
-        QToolBar {{
-            background-color: {dark_theme['sidebar']};
-            border: none;
-            spacing: 0px;
-        }}
-        
-        QToolButton {{
-            background-color: transparent;
-            border: none;
-            padding: 5px;
-            color: {dark_theme['foreground']};
-        }}
-        
-        QToolButton:hover {{
-            background-color: {dark_theme['inactive_selection']};
-        }}
-        
-        /* Dock widget styling */
-        QDockWidget {{
-            titlebar-close-icon: url(close.png);
-            titlebar-normal-icon: url(undock.png);
-        }}
-        
-        QDockWidget::title {{
-            text-align: left;
-            background-color: {dark_theme['sidebar']};
-            color: #ffffff;  /* White color for better contrast */
-            padding: 5px;
-        }}
-        
-        QDockWidget::close-button, QDockWidget::float-button {{
-            border: none;
-            background: transparent;
-            padding: 0px;
-        }}
-        """
-        
-        # Apply the style to all widgets except TabWidget which already has specific styling
-        self.setStyleSheet(vs_code_style)
-    
+        # _MAIN_WINDOW_QSS does not depend on the font size, so it is not reapplied here
+        self.update() # The title bar height follows from _title_bar_height_dirty_timer
+
     def setup_async_loop(self):
-        """Set up the asyncio event loop and integrate with PySide6."""
-        self.loop = asyncio.new_event_loop()
+        """Set up the asyncio event loop, driven by Qt's own event dispatcher via qasync."""
+        self.loop = qasync.QEventLoop(QApplication.instance())
         asyncio.set_event_loop(self.loop)
-        
-        # Create a timer to run the asyncio event loop
-        self.async_timer = QTimer(self)
-        self.async_timer.timeout.connect(self._process_asyncio_events)
-        self.async_timer.start(10)  # 10ms interval
-    
-    def _process_asyncio_events(self):
-        """Process pending asyncio events."""
-        self.loop.call_soon(self._run_event_loop_iteration)
-    
-    def _run_event_loop_iteration(self):
-        """Run a single iteration of the asyncio event loop."""
-        try:
-            self.loop.stop()
-            self.loop.run_forever()
-        except Exception as e:
-            print(f"Error in asyncio event loop: {e}")
     
     async def run_async_task(self, coro):
         """Run an asynchronous task."""
         try:
             return await coro
         except Exception as e:
-            print(f"Error in async task: {e}")
+            log.error("Error in async task: %s", e)
             return None
     
     def schedule_async_task(self, coro):
         """Schedule an asynchronous task to be run in the asyncio loop."""
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        return future
+        return self.loop.create_task(coro) # Always called on the GUI thread, which runs the loop
     
     def restore_window_state(self):
         """Restore the window state from the configuration."""
@@ -2429,16 +2514,20 @@ class StudioMainWindow(QMainWindow):
         pass # Keep the method for now, but its core is moved
     
     def save_window_state(self):
+        """Request a save of the window state and configuration; bursts of requests coalesce into one write."""
+        self._save_timer.start()
+
+    def _do_save_window_state(self):
         """Save the current window state to the configuration."""
         # Use the geometry manager
         self.geometry_manager.save_geometry()
 
         # Save other StudioMainWindow-specific states
         self.config.settings.is_maximized = self.isMaximized()
-        if hasattr(self.explorer_container, 'width'): # Check if container exists
+        if self.explorer_container is not None:
             self.config.settings.explorer_width = self.explorer_container.width()
-        self.config.settings.state = self.saveState()
-        if hasattr(self.explorer, 'initial_dir'): # Check if explorer exists
+        self.config.settings.state = bytes(self.saveState()) # Raw bytes, no text encoding
+        if self.explorer is not None:
             self.config.initial_dir = self.explorer.initial_dir
         self.config.settings.global_font_size_adjust = self.global_font_size_adjust
         
@@ -2452,11 +2541,10 @@ class StudioMainWindow(QMainWindow):
             self.inspector_window_instance.close() # This will trigger its own save routines
             self.inspector_window_instance = None # Ensure reference is cleared here too
 
-        # Save main window state
-        self.save_window_state()
-        
-        # Clean up asyncio loop
-        self.async_timer.stop()
+        # Save main window state now, superseding any pending debounced save
+        self._save_timer.stop()
+        self._do_save_window_state()
+        flush_settings_writes()
         
         # Accept the close event
         event.accept()
@@ -2489,6 +2577,8 @@ class StudioMainWindow(QMainWindow):
     
     def toggle_explorer(self, checked: bool):
         """Toggle the explorer panel."""
+        if self.windowState() & Qt.WindowMinimized:
+            return
         self.explorer_container.setVisible(checked)
     
     def on_about(self):
@@ -2507,75 +2597,65 @@ class StudioMainWindow(QMainWindow):
 
     def showMessage(self, message: str, timeout: int = 0):
         """Show a message in the status bar."""
-        if self._main_status_message_label is not None:
-            self._main_status_message_label.setText(message)
-            # QStatusBar.showMessage also has a timeout feature for temporary messages.
-            # If we want to replicate that, we'd need a QTimer here when timeout > 0.
-            # For now, setText makes it persistent until the next call.
+        label = self._main_status_message_label
+        if label is not None:
+            if label.text() != message: # setText relayouts and repaints even for the same text
+                label.setText(message)
+            # Temporary messages are cleared by one reused single-shot timer; a later
+            # message replaces the pending expectation so it is never cleared early
+            self._status_expected = message
             if timeout > 0:
-                # Simple way to clear after timeout, could be more robust
-                QTimer.singleShot(timeout, lambda: self._main_status_message_label.setText("") if self._main_status_message_label.text() == message else None)
-        elif hasattr(self, 'status_bar'): # Fallback if no specific label is set
+                self._status_clear_timer.start(timeout)
+            else:
+                self._status_clear_timer.stop()
+        elif self.status_bar is not None: # Fallback if no specific label is set
             self.status_bar.showMessage(message, timeout)
 
+    def _clear_status_if_match(self):
+        """Clear the status message label if it still shows the timed message."""
+        if self._main_status_message_label is not None and self._main_status_message_label.text() == self._status_expected:
+            self._main_status_message_label.setText("")
+        self._status_expected = None
+
     def setup_status_bar(self):
         """Set up a status bar similar to VS Code."""
         self.status_bar = QStatusBar()
         self.status_bar.setObjectName("status_bar")
         self.status_bar.setSizeGripEnabled(False)
         self.setStatusBar(self.status_bar)
-        
-        # Style the status bar
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #007acc;
-                color: white;
-                padding: 0px;
-                font-size: 9pt;
-            }
-            QLabel { /* Default for labels within status bar if not overridden */
-                padding: 3px 5px;
-                margin: 0px;
-                background-color: transparent; /* Ensure transparency against blue bar */
-                color: white; /* Ensure white text */
-            }
-        """)
+
+        # Shared timer for clearing temporary messages posted via showMessage
+        self._status_clear_timer = QTimer(self)
+        self._status_clear_timer.setSingleShot(True)
+        self._status_clear_timer.timeout.connect(self._clear_status_if_match)
+        self._status_expected: Optional[str] = None
         
         # Permanent widgets and main status message will be added by the customizer
 
     def add_status_bar_widget(self, widget: QWidget, stretch: int = 0):
         """Adds a widget to the status bar (typically left side)."""
-        if hasattr(self, 'status_bar'):
+        if self.status_bar is not None:
             self.status_bar.addWidget(widget, stretch)
 
     def add_status_bar_permanent_widget(self, widget: QWidget, stretch: int = 0):
         """Adds a permanent widget to the status bar (typically right side)."""
-        if hasattr(self, 'status_bar'):
+        if self.status_bar is not None:
             self.status_bar.addPermanentWidget(widget, stretch)
 
     def set_main_status_message_label(self, label: QLabel):
         """Sets the QLabel instance that should be used for showMessage()."""
         self._main_status_message_label = label
 
-    def show_title_bar_context_menu(self, pos):
-        """Show context menu for the title bar when right-clicked."""
+    def _build_title_bar_context_menu(self):
+        """Create the title bar context menu once; show_title_bar_context_menu reuses it."""
         context_menu = QMenu(self)
         
-        restore_action = None
-        maximize_action = None
-
-        if self.isMaximized():
-            restore_action = context_menu.addAction("Restore")
-        else:
-            maximize_action = context_menu.addAction("Maximize")
-        
+        # Restore/Maximize/Size are all created; visibility follows the window state at show time
+        self._ctx_restore_action = context_menu.addAction("Restore")
+        self._ctx_maximize_action = context_menu.addAction("Maximize")
         move_action = context_menu.addAction("Move")
-        
-        size_action = None
-        if not self.isMaximized():
-            size_action = context_menu.addAction("Size")
-        
-        open_inspector_action_ctx = context_menu.addAction("Open Inspector") # Added here
+        self._ctx_size_action = context_menu.addAction("Size")
+        open_inspector_action_ctx = context_menu.addAction("Open Inspector")
 
         context_menu.addSeparator()
         
@@ -2589,53 +2669,84 @@ class StudioMainWindow(QMainWindow):
         minimize_action = context_menu.addAction("Minimize")
         context_menu.addSeparator()
         close_action = context_menu.addAction("Close")
+
+        self._ctx_handlers = {
+            self._ctx_restore_action: self._ctx_restore,
+            self._ctx_maximize_action: self._ctx_maximize,
+            move_action: self._ctx_start_move,
+            self._ctx_size_action: self._ctx_start_system_size,
+            open_inspector_action_ctx: self.on_open_inspector,
+            minimize_action: self.showMinimized,
+            close_action: self.close,
+            open_file_action: self.on_open_file,
+            open_folder_action: self.on_open_folder,
+            settings_action: lambda: self.showMessage("Settings not implemented yet"),
+        }
+        self._title_bar_context_menu = context_menu
+
+    def show_title_bar_context_menu(self, pos):
+        """Show context menu for the title bar when right-clicked."""
+        if self._title_bar_context_menu is None:
+            self._build_title_bar_context_menu()
+
+        maximized = self.isMaximized()
+        self._ctx_restore_action.setVisible(maximized)
+        self._ctx_maximize_action.setVisible(not maximized)
+        self._ctx_size_action.setVisible(not maximized)
         
         # Map position to global for exec()
-        action = context_menu.exec(self.title_bar.mapToGlobal(pos))
-        
-        if action:
-            if restore_action and action == restore_action:
-                self.showNormal()
-                self.maximize_button.setText("□")
-            elif maximize_action and action == maximize_action:
-                self.showMaximized()
-                self.maximize_button.setText("❐")
-            elif action == move_action:
-                # print("Context Menu: Activating manual move mode (timer-based).")
-                self.is_context_menu_moving = True
-                self.context_menu_drag_start_position = QCursor.pos()
-                self.context_menu_window_start_position = self.pos()
-                QApplication.setOverrideCursor(Qt.SizeAllCursor) 
-                self.context_move_timer.start()
-                self.grabMouse() # Grab all mouse events for the window
-                # print("Context Menu: Mouse grabbed.")
-            elif size_action and action == size_action:
-                if sys.platform == "win32" and self.SendMessage and self.ReleaseCapture:
-                    try:
-                        # print("Context Menu: Attempting resize with WM_SYSCOMMAND | SC_SIZE (BottomRight)")
-                        self.ReleaseCapture()
-                        self.SendMessage(int(self.winId()), 0x0112, 0xF008, 0) # WM_SYSCOMMAND, SC_SIZE + WMSZ_BOTTOMRIGHT
-                    except Exception as e:
-                        print(f"Error initiating system resize from context menu with WM_SYSCOMMAND: {e}") # Keep error prints
-            elif open_inspector_action_ctx and action == open_inspector_action_ctx: # Added condition
-                self.on_open_inspector() # Connect to existing handler
-            elif action == minimize_action:
-                self.showMinimized()
-            elif action == close_action:
-                self.close()
-            elif action == open_file_action: self.on_open_file()
-            elif action == open_folder_action: self.on_open_folder()
-            elif action == settings_action: self.showMessage("Settings not implemented yet")
+        action = self._title_bar_context_menu.exec(self.title_bar.mapToGlobal(pos))
+        handler = self._ctx_handlers.get(action)
+        if handler is not None:
+            handler()
+
+    def _ctx_restore(self):
+        with self._with_title_bar_frozen():
+            self.showNormal()
+            self.maximize_button.setIcon(_icon("maximize"))
+
+    def _ctx_maximize(self):
+        with self._with_title_bar_frozen():
+            self.showMaximized()
+            self.maximize_button.setIcon(_icon("restore"))
+
+    def _ctx_start_move(self):
+        # print("Context Menu: Activating manual move mode (timer-based).")
+        self.is_context_menu_moving = True
+        self.context_menu_drag_start_position = QCursor.pos()
+        self.context_menu_window_start_position = self.pos()
+        self._last_ctx_move_pos = self.context_menu_drag_start_position # Window already there
+        QApplication.setOverrideCursor(Qt.SizeAllCursor) 
+        self.context_move_timer.start()
+        self.grabMouse() # Grab all mouse events for the window
+        # print("Context Menu: Mouse grabbed.")
+        # Only while moving: any press anywhere in the application ends the move
+        if self._ctx_move_filter is None:
+            self._ctx_move_filter = _ContextMoveFilter(self._stop_context_menu_move, self)
+        QApplication.instance().installEventFilter(self._ctx_move_filter)
+
+    def _stop_context_menu_move(self):
+        # print("Context Menu: Click received, terminating timer-based context menu move mode.")
+        QApplication.instance().removeEventFilter(self._ctx_move_filter)
+        self.context_move_timer.stop() 
+        self.is_context_menu_moving = False
+        self.releaseMouse() # Release the mouse grab
+        QApplication.restoreOverrideCursor() 
+        # print("Context Menu: Mouse released and cursor restored.")
+
+    def _ctx_start_system_size(self):
+        if sys.platform == "win32" and self._ensure_win32_api():
+            try:
+                # print("Context Menu: Attempting resize with WM_SYSCOMMAND | SC_SIZE (BottomRight)")
+                self.ReleaseCapture()
+                self.SendMessage(int(self.winId()), 0x0112, 0xF008, 0) # WM_SYSCOMMAND, SC_SIZE + WMSZ_BOTTOMRIGHT
+            except Exception as e:
+                log.warning("Error initiating system resize from context menu with WM_SYSCOMMAND: %s", e)
 
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press events for window dragging and terminating context menu move."""
-        if self.is_context_menu_moving:
-            # print("mousePressEvent: Click received, terminating timer-based context menu move mode.")
-            self.context_move_timer.stop() 
-            self.is_context_menu_moving = False
-            self.releaseMouse() # Release the mouse grab
-            QApplication.restoreOverrideCursor() 
-            # print("mousePressEvent: Mouse released and cursor restored.")
+        if self.is_context_menu_moving: # Normally ended by _ContextMoveFilter before we get here
+            self._stop_context_menu_move()
             event.accept() 
             return
 
@@ -2649,30 +2760,28 @@ class StudioMainWindow(QMainWindow):
             # mapped_global_title_bar_origin = self.title_bar.mapToGlobal(QPoint(0,0))
             # print(f"mousePressEvent: self.title_bar.mapToGlobal(QPoint(0,0)): {mapped_global_title_bar_origin}")
 
-            title_bar_global_rect = QRect(self.title_bar.mapToGlobal(QPoint(0,0)), self.title_bar.size())
-            event_global_pos = event.globalPosition().toPoint()
-            # print(f"mousePressEvent: Title bar global rect: {title_bar_global_rect}, Event global pos: {event_global_pos}")
+            # Hit test in title bar coordinates: one global->local mapping per press
+            title_bar_pos = self.title_bar.mapFromGlobal(event.globalPosition().toPoint())
+            lx, ly = title_bar_pos.x(), title_bar_pos.y()
+            # print(f"mousePressEvent: Title bar local pos: {title_bar_pos}")
 
-            if title_bar_global_rect.contains(event_global_pos) and self.title_bar.isVisible():
-                # print("mousePressEvent: Click is within title bar global rect and title bar is visible.")
+            if self.title_bar.rect().contains(title_bar_pos) and self.title_bar.isVisible():
+                # print("mousePressEvent: Click is within title bar rect and title bar is visible.")
+                if self._title_bar_hit_cache_dirty:
+                    self._rebuild_title_bar_hit_cache()
                 
                 on_control = False
-                for child_widget in self.title_bar.findChildren(QWidget):
-                    if not child_widget.isVisible():
-                        continue
-                    
-                    child_global_origin = child_widget.mapToGlobal(QPoint(0,0))
-                    child_global_rect = QRect(child_global_origin, child_widget.size())
-                    # print(f"mousePressEvent: Checking child {child_widget.objectName()} ({type(child_widget)}) at global rect {child_global_rect}")
-
-                    if child_global_rect.contains(event_global_pos):
+                for child_widget, kind, x0, y0, x1, y1 in self._title_bar_hit_cache:
+                    # print(f"mousePressEvent: Checking child {child_widget.objectName()} ({kind}) at {(x0, y0, x1, y1)}")
+
+                    if x0 <= lx < x1 and y0 <= ly < y1 and child_widget.isVisible():
                         # print(f"mousePressEvent: Click was on child {child_widget.objectName()}")
-                        if isinstance(child_widget, QPushButton):
+                        if kind == "button":
                             # print(f"mousePressEvent: Child {child_widget.objectName()} is a QPushButton. Passing event.")
                             on_control = True
                             break 
-                        elif child_widget == self.menu_bar: 
-                            local_pos_in_menubar = self.menu_bar.mapFromGlobal(event_global_pos)
+                        elif kind == "menubar": 
+                            local_pos_in_menubar = QPoint(lx - x0, ly - y0)
                             active_action = self.menu_bar.actionAt(local_pos_in_menubar)
                             if active_action:
                                 # print(f"mousePressEvent: Click was on an active action ('{active_action.text()}') in the QMenuBar. Passing event.")
@@ -2684,27 +2793,18 @@ class StudioMainWindow(QMainWindow):
                 
                 if not on_control:
                     # print("mousePressEvent: Click was not on a defined control (or on menu bar background). Attempting system drag.")
-                    if sys.platform == "win32" and self.SendMessage and self.ReleaseCapture:
-                        try:
-                            # print("Attempting drag with WM_SYSCOMMAND | SC_MOVE") 
-                            self.ReleaseCapture()
-                            self.SendMessage(int(self.winId()), 0x0112, 0xF012, 0)
-                            event.accept()
-                            return 
-                        except Exception as e:
-                            print(f"Error initiating system drag with WM_SYSCOMMAND: {e}") # Keep error print
-                            self.dragging = True
-                            self.drag_start_position = event.globalPosition().toPoint()
-                            self.window_start_position = self.pos()
-                            event.accept()
-                            return
-                    else:
-                        # print("mousePressEvent: Fallback to manual drag.")
-                        self.dragging = True
-                        self.drag_start_position = event.globalPosition().toPoint()
-                        self.window_start_position = self.pos()
+                    # The window system moves the window itself, so no mouse moves reach Python
+                    handle = self.windowHandle()
+                    if handle is not None and handle.startSystemMove():
                         event.accept()
                         return
+                    # print("mousePressEvent: Fallback to manual drag.")
+                    # Platform cannot do it (e.g. offscreen); mouseMoveEvent moves the window instead
+                    self.dragging = True
+                    self.drag_start_position = event.globalPosition().toPoint()
+                    self.window_start_position = self.pos()
+                    event.accept()
+                    return
                 # else:
                     # print("mousePressEvent: Click was on a defined control (QPushButton or QMenuBar action), not starting drag.")
             # else:
@@ -2713,42 +2813,44 @@ class StudioMainWindow(QMainWindow):
         # print("mousePressEvent: Event not handled for dragging, passing to super().")
         super().mousePressEvent(event)
 
+    def _invalidate_title_bar_hit_cache(self):
+        self._title_bar_hit_cache_dirty = True
+
+    def _rebuild_title_bar_hit_cache(self):
+        """Record the rects of the title bar's controls in title bar coordinates.
+
+        Only buttons and the menu bar are kept; a press anywhere else drags the window.
+        """
+        cache = []
+        for child_widget in self.title_bar.findChildren(QWidget):
+            kind = child_widget.property(_HIT_KIND_PROPERTY)
+            if not kind:
+                continue
+            origin = child_widget.mapTo(self.title_bar, QPoint(0, 0))
+            x0, y0 = origin.x(), origin.y()
+            cache.append((child_widget, kind, x0, y0, x0 + child_widget.width(), y0 + child_widget.height()))
+        self._title_bar_hit_cache = cache
+        self._title_bar_hit_cache_dirty = False
+
     def mouseMoveEvent(self, event: QMouseEvent):
         """Handle mouse move events for window dragging (manual fallback).""" 
         # print(f"mouseMoveEvent entered. QCursor.pos(): {QCursor.pos()}, buttons: {event.buttons()}")
 
         if self.dragging and event.buttons() & Qt.LeftButton:
             delta = event.globalPosition().toPoint() - self.drag_start_position
-            new_pos = self.window_start_position + delta
-            self.move(new_pos)
+            self._pending_move_pos = self.window_start_position + delta
+            if not self._drag_throttle.isActive():
+                self._drag_throttle.start()
             event.accept()
             return
         
-        # For non-Windows platforms, or if nativeEvent-based resizing isn't active,
-        # set resize cursors manually.
-        if not self.isMaximized():
-            if sys.platform != "win32": # Primarily for non-Windows
-                pos = event.position().toPoint()
-                direction = self.get_resize_direction(pos)
-                if direction:
-                    self.setCursor(self.get_resize_cursor(direction))
-                else:
-                    self.setCursor(Qt.ArrowCursor)
-            elif not self.ReleaseCapture: # Or if WinAPI calls are not available as a fallback
-                pos = event.position().toPoint()
-                direction = self.get_resize_direction(pos)
-                if direction:
-                    self.setCursor(self.get_resize_cursor(direction))
-                else:
-                    self.setCursor(Qt.ArrowCursor)
-            else: # On Windows with API, usually OS handles cursors via WM_NCHITTEST
-                self.setCursor(Qt.ArrowCursor) # Default unless nativeEvent overrides
-
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Handle mouse release events for window dragging (manual fallback)."""
         if event.button() == Qt.LeftButton and self.dragging:
+            self._drag_throttle.stop()
+            self._apply_pending_move() # Land exactly where the mouse was released
             self.dragging = False
             self.drag_start_position = None
             self.window_start_position = None
@@ -2757,59 +2859,26 @@ class StudioMainWindow(QMainWindow):
             return
         super().mouseReleaseEvent(event)
 
-    def get_resize_direction(self, pos: QPoint) -> str:
-        """Get the resize direction based on mouse position."""
-        if self.isMaximized(): return '' # No resize if maximized
-        rect = self.rect() # Client rectangle
-        padding = self.resize_handle_thickness
-        
-        # Corrected conditions for 0-indexed client area coordinates
-        # Max valid x is rect.width() - 1, max valid y is rect.height() - 1
-        on_left = pos.x() < padding # For x in [0, padding-1]
-        on_right = pos.x() >= rect.width() - padding # For x in [width-padding, width-1]
-        on_top = pos.y() < padding # For y in [0, padding-1]
-        on_bottom = pos.y() >= rect.height() - padding # For y in [height-padding, height-1]
-
-        # Ensure position is within the window bounds for edge detection to be valid
-        # Although mapFromGlobal in nativeEvent handles this, good for general purpose fn
-        if not rect.contains(pos):
-             # If outside the main client rect, but could be on a thicker conceptual border,
-             # the simple padding checks might still be relevant if padding is interpreted broadly.
-             # However, for strict client area padding, this check is useful.
-             # For now, let the simple boundary checks decide, as WM_NCHITTEST operates on window coords.
-             pass 
-
-        if on_top and on_left: return 'top-left'
-        if on_bottom and on_left: return 'bottom-left'
-        if on_top and on_right: return 'top-right'
-        if on_bottom and on_right: return 'bottom-right'
-        if on_left: return 'left'
-        if on_right: return 'right'
-        if on_top: return 'top'
-        if on_bottom: return 'bottom'
-        return ''
-
-    def get_resize_cursor(self, direction: str) -> Qt.CursorShape:
-        """Get the cursor shape for the resize direction."""
-        if direction in ('top-left', 'bottom-right'): return Qt.SizeFDiagCursor
-        if direction in ('top-right', 'bottom-left'): return Qt.SizeBDiagCursor
-        if direction in ('left', 'right'): return Qt.SizeHorCursor
-        if direction in ('top', 'bottom'): return Qt.SizeVerCursor
-        return Qt.ArrowCursor
+    def _apply_pending_move(self):
+        # Sub-pixel mouse travel often lands on the position the window already has
+        if self._pending_move_pos is not None and self._pending_move_pos != self.pos():
+            self.move(self._pending_move_pos)
+        self._pending_move_pos = None
 
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         """Handle double-click events for title bar maximize/restore."""
         if event.button() == Qt.LeftButton:
-            global_title_bar_pos = self.title_bar.mapToGlobal(QPoint(0,0))
             local_event_pos_in_title_bar = self.title_bar.mapFromGlobal(event.globalPosition().toPoint())
 
             if self.title_bar.rect().contains(local_event_pos_in_title_bar) and self.title_bar.isVisible():
+                if self._title_bar_hit_cache_dirty:
+                    self._rebuild_title_bar_hit_cache()
                 on_control = False
-                for child_widget in self.title_bar.findChildren(QWidget):
-                    if child_widget.isVisible() and child_widget.rect().contains(child_widget.mapFromGlobal(event.globalPosition().toPoint())):
-                        if isinstance(child_widget, (QPushButton, QMenuBar)):
-                            on_control = True
-                            break
+                lx, ly = local_event_pos_in_title_bar.x(), local_event_pos_in_title_bar.y()
+                for child_widget, kind, x0, y0, x1, y1 in self._title_bar_hit_cache:
+                    if x0 <= lx < x1 and y0 <= ly < y1 and child_widget.isVisible():
+                        on_control = True
+                        break
                 
                 if not on_control:
                     self.toggle_maximize()
@@ -2822,14 +2891,24 @@ class StudioMainWindow(QMainWindow):
         # Reverted to simple pass-through. Resize and custom cursor logic via native events is removed.
         return super().nativeEvent(eventType, message)
 
+    @contextlib.contextmanager
+    def _with_title_bar_frozen(self):
+        """Suspend title bar painting so a burst of title bar changes repaints once."""
+        self.title_bar.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.title_bar.setUpdatesEnabled(True)
+
     def toggle_maximize(self):
         """Toggle maximize/restore window state."""
-        if self.isMaximized():
-            self.showNormal()
-            self.maximize_button.setText("□") # Update button text
-        else:
-            self.showMaximized()
-            self.maximize_button.setText("❐") # Update button text
+        with self._with_title_bar_frozen():
+            if self.isMaximized():
+                self.showNormal()
+                self.maximize_button.setIcon(_icon("maximize"))
+            else:
+                self.showMaximized()
+                self.maximize_button.setIcon(_icon("restore"))
     
     def setup_menu_items(self):
         # Menu bar is created in StudioMainWindow.setup_ui and attached to title_bar_layout
@@ -2837,106 +2916,70 @@ class StudioMainWindow(QMainWindow):
         pass
 
     def increase_font_size(self):
-        print("increase_font_size called") # Debug
+        log.debug("increase_font_size called")
         self.global_font_size_adjust += 1
         self._apply_global_font_change()
+        self.save_window_state()
 
     def decrease_font_size(self):
-        print("decrease_font_size called") # Debug
+        log.debug("decrease_font_size called")
         # Prevent font size from becoming too small or negative
         if (self.initial_app_font_point_size + self.global_font_size_adjust) > 1:
             self.global_font_size_adjust -= 1
             self._apply_global_font_change()
+            self.save_window_state()
         else:
-            print("decrease_font_size: Font size too small to decrease further.") # Debug
+            log.debug("decrease_font_size: Font size too small to decrease further.")
 
     def toggle_welcome_panel(self, checked: bool):
-        if hasattr(self, 'welcome_dock'):
+        if self.windowState() & Qt.WindowMinimized:
+            return
+        if self.welcome_dock is not None:
             self.welcome_dock.setVisible(checked)
 
     def _perform_context_menu_move(self):
         if not self.is_context_menu_moving:
             return
 
+        # Position from the start point and total cursor travel, so a move the window
+        # manager clamps is not accumulated into later ones
         current_mouse_pos = QCursor.pos()
+        if current_mouse_pos == self._last_ctx_move_pos:
+            return # Cursor idle since the last tick; don't issue a redundant move
         delta = current_mouse_pos - self.context_menu_drag_start_position
-        new_pos = self.context_menu_window_start_position + delta
-        self.move(new_pos)
+        self.move(self.context_menu_window_start_position + delta)
+        self._last_ctx_move_pos = current_mouse_pos
 
     def toggle_fullscreen(self):
-        if self.isFullScreen():
-            self.showNormal()
-            # Update maximize button if we came from maximized state before fullscreen
-            if self.was_maximized_before_fullscreen:
-                self.maximize_button.setText("❐")
+        with self._with_title_bar_frozen():
+            if self.isFullScreen():
+                self.showNormal()
+                # Update maximize button if we came from maximized state before fullscreen
+                if self.was_maximized_before_fullscreen:
+                    self.maximize_button.setIcon(_icon("restore"))
+                else:
+                    self.maximize_button.setIcon(_icon("maximize"))
             else:
-                self.maximize_button.setText("□")
-        else:
-            self.was_maximized_before_fullscreen = self.isMaximized()
-            self.showFullScreen()
-        # Update the check state of the menu action
-        # Assuming the action is stored or can be found. For now, let's find it.
-        for action in self.menu_bar.findChildren(QAction):
-            if action.text() == "Toggle &Fullscreen":
-                action.setChecked(self.isFullScreen())
-                break
+                self.was_maximized_before_fullscreen = self.isMaximized()
+                self.showFullScreen()
+            # Update the check state of the menu action
+            if self.toggle_fullscreen_action is not None:
+                self.toggle_fullscreen_action.setChecked(self.isFullScreen())
 
     def on_open_inspector(self):
         if self.inspector_window_instance is None:
             self.inspector_window_instance = InspectorWindow(main_app_window=self)
-            self.inspector_window_instance.show()
-            # Restore geometry AFTER showing the window for the first time
-            self.inspector_window_instance.geometry_manager.restore_geometry()
-            QApplication.processEvents() # Allow Qt to process show and move/resize
+            inspector = self.inspector_window_instance
+            inspector.show()
+            # Restore geometry AFTER showing the window for the first time, once control is
+            # back in the event loop (the inspector is the context, so a close cancels it)
+            QTimer.singleShot(0, inspector, inspector.geometry_manager.restore_geometry)
         else:
             # If already exists, its geometry should be current from last session or use.
             # Just ensure it's visible and brought to the front.
             self.inspector_window_instance.show() 
             self.inspector_window_instance.activateWindow()
 
-    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
-        # Check for stopping context menu move first, as this should be global
-        if self.is_context_menu_moving and event.type() == QEvent.Type.MouseButtonPress:
-            # This event is a QMouseEvent, need to cast to access button()
-            # However, any mouse button press should stop the mode.
-            # print(f"eventFilter: MouseButtonPress detected during context_menu_moving. Stopping move.")
-            self.context_move_timer.stop()
-            self.is_context_menu_moving = False
-            self.releaseMouse() # Release the mouse grab
-            QApplication.restoreOverrideCursor()
-            # print("eventFilter: Mouse released and cursor restored.")
-            # Consume the event to prevent the underlying widget from processing it
-            # (e.g., QTabWidget trying to change tabs on the click that stops the move)
-            return True # Event handled
-
-        # Existing eventFilter logic for logging and menu bar dragging
-        if event.type() == QEvent.Type.MouseButtonPress:
-            mouse_event = event # PySide6 handles the cast from QEvent to QMouseEvent here
-            watched_name = watched.objectName() if watched.objectName() else type(watched).__name__
-            button_name = "Unknown"
-            if mouse_event.button() == Qt.MouseButton.LeftButton: button_name = "LeftButton"
-            elif mouse_event.button() == Qt.MouseButton.RightButton: button_name = "RightButton"
-            elif mouse_event.button() == Qt.MouseButton.MiddleButton: button_name = "MiddleButton"
-            
-            # print(f"eventFilter on '{watched_name}': MouseButtonPress, button: {button_name}, globalPos: {mouse_event.globalPosition().toPoint()}")
-
-            # If the event is a left-click on the menu_bar, forward it to the main mousePressEvent
-            # This is for allowing drag on the menubar background when it has no active action
-            if watched == self.menu_bar and mouse_event.button() == Qt.MouseButton.LeftButton:
-                # print(f"eventFilter: Forwarding MouseButtonPress on '{watched_name}' to self.mousePressEvent for potential drag")
-                # Call the main handler. Note: mousePressEvent itself checks for is_context_menu_moving first.
-                # If we are here, is_context_menu_moving was false, so this is for title bar drag.
-                self.mousePressEvent(mouse_event) 
-                
-                if mouse_event.isAccepted():
-                    # print(f"eventFilter: self.mousePressEvent accepted the event for '{watched_name}'. Returning True.")
-                    return True # Event was handled (e.g., for dragging)
-                else:
-                    # print(f"eventFilter: self.mousePressEvent did NOT accept the event for '{watched_name}'. Returning False to allow widget's own processing.")
-                    return False # Event not handled by drag logic, let the original widget (menu_bar) process it
-        
-        return False
-
     def _adjust_splitter_handle_width(self):
         """Adjust splitter handle width based on panel visibility."""
         sizes = self.splitter.sizes()
@@ -2965,43 +3008,12 @@ def parse_args():
     )
     return parser.parse_args()
 
-def main(customerizer: AppCustomizer):
-    """Main entry point for the application."""
-    # Parse command line arguments
-    args = parse_args()
-    
-    # Update config based on arguments
-    config = AppConfig.load()
-    if args.dir:
-        if os.path.isdir(args.dir):
-            config.initial_dir = args.dir
-    
-    # Create application
-    app = QApplication(sys.argv)
-    app.setOrganizationName(config.org_name)
-    app.setApplicationName(config.app_name)
-    
-    # Get system font and size for consistency
-    system_font = app.font()
-    system_font_family = system_font.family()
-    system_font_size = 10  # Default consistent size
-    
-    # Create a consistent application font
-    default_font = QFont(system_font_family, system_font_size)
-    app.setFont(default_font)
-    
-    # Set specific font sizes for different widget classes
-    # This directly sets font for specific widget classes
-    app.setFont(default_font, "QDockWidget")
-    app.setFont(QFont(system_font_family, system_font_size - 1), "QStatusBar")
-    
-    # Apply VS Code-like style to the application
-    # Using light theme colors similar to VS Code
-    vs_code_style = f"""
+# Application-wide light theme; braces are doubled for str.format
+_VS_CODE_QSS_TEMPLATE = """
     /* Global application style */
     QWidget {{
-        font-family: {system_font_family};
-        /* font-size: {system_font_size}pt; */ /* Commented out to allow QApplication.setFont to control base size */
+        font-family: {font_family};
+        /* font-size: {size}pt; */ /* Commented out to allow QApplication.setFont to control base size */
         color: #333333;
         background-color: #ffffff;
     }}
@@ -3084,11 +3096,11 @@ def main(customerizer: AppCustomizer):
     /* Dock widget styling */
     QDockWidget {{
         border: 1px solid #e0e0e0;
-        font-size: {system_font_size}pt;
+        font-size: {size}pt;
     }}
     
     QDockWidget::title {{
-        font-size: {system_font_size}pt;
+        font-size: {size}pt;
         padding: 5px;
         background-color: #f0f0f0;
         border: 1px solid #ddd;
@@ -3193,7 +3205,7 @@ def main(customerizer: AppCustomizer):
     
     /* Message boxes */
     QMessageBox {{
-        font-size: {system_font_size}pt;
+        font-size: {size}pt;
     }}
     
     QMessageBox QLabel {{
@@ -3202,29 +3214,80 @@ def main(customerizer: AppCustomizer):
     
     /* Dialog styling */
     QDialog {{
-        font-size: {system_font_size}pt;
+        font-size: {size}pt;
         background-color: #f5f5f5;
     }}
     
     /* Tooltip styling */
     QToolTip {{
-        font-size: {system_font_size - 1}pt;
+        font-size: {size_minus_1}pt;
         padding: 2px;
         border: 1px solid #e0e0e0;
         background-color: #ffffff;
         color: #333333;
     }}
     """
+
+@functools.cache
+def _app_stylesheet(font_family: str, size: int) -> str:
+    """The application stylesheet for the given font, formatted once per font."""
+    return _VS_CODE_QSS_TEMPLATE.format(font_family=font_family, size=size, size_minus_1=size - 1)
+
+def main(customerizer: AppCustomizer):
+    """Main entry point for the application."""
+    logging.basicConfig(level=logging.WARNING)
+    # Skip Qt's per-repaint subtraction of opaque sibling regions. The window's widgets
+    # (title bar, explorer, splitter, tabs, status bar) are laid out side by side; the only
+    # overlapping children are the thin edge handles and the inspector overlay, so the pass
+    # saves almost no painting. Must be set before any widget is created.
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
+
+    # Parse command line arguments
+    args = parse_args()
+    
+    # Coalesce bursts of mouse move/wheel events so mouseMoveEvent runs once per batch
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+
+    # Create application
+    app = QApplication(sys.argv)
+    app.setOrganizationName(AppConfig.org_name)
+    app.setApplicationName(AppConfig.app_name)
+
+    # Read the settings on a pool thread while fonts and the stylesheet are set up
+    QThreadPool.globalInstance().start(AppConfig.load)
+    
+    # Get system font and size for consistency
+    system_font = app.font()
+    system_font_family = system_font.family()
+    system_font_size = 10  # Default consistent size
+    
+    # Create a consistent application font
+    default_font = QFont(system_font_family, system_font_size)
+    app.setFont(default_font)
+    # Dock widgets take the font size from the stylesheet; the status bar is fixed at 9pt
+    
+    # Apply VS Code-like style to the application
+    # Using light theme colors similar to VS Code
+    vs_code_style = _app_stylesheet(system_font_family, system_font_size)
     
     app.setStyleSheet(vs_code_style)
     
+    # Picks up the pool thread's result, waiting on the config lock if it is still reading
+    config = AppConfig.load()
+    if args.dir:
+        if os.path.isdir(args.dir):
+            config.initial_dir = args.dir
+    
     # Create main window
     window = StudioMainWindow(config)
     customerizer.customise(window)
     window.show()
     
-    # Run the Qt event loop
-    sys.exit(app.exec())
+    # Run the Qt event loop through qasync so coroutines see a running asyncio loop;
+    # run_forever() returns app.exec()'s exit code
+    with window.loop:
+        exit_code = window.loop.run_forever()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
-    asyncio.run(main(DefaultAppCustomizer())) 
\ No newline at end of file
+    main(DefaultAppCustomizer()) # Synchronous; the asyncio loop is qasync's, created by the window
\ No newline at end of file
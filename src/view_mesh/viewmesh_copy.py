@@ -1,25 +1,61 @@
 import argparse
 import asyncio
+import base64
+import functools
 import json
+import logging
 import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Optional, Tuple, Any
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QDockWidget, QFileSystemModel, 
-    QTreeView, QVBoxLayout, QWidget, QMenuBar, QMenu, QStatusBar,
-    QSplitter, QTabWidget, QToolBar, QMessageBox
+    QTreeView, QVBoxLayout, QWidget, QStatusBar,
+    QSplitter, QTabWidget, QToolBar, QMessageBox, QMenu
 )
 from PySide6.QtCore import (
-    Qt, QDir, QModelIndex, QSize, QPoint, QSettings, 
-    QEvent, QFile, QStandardPaths, Signal, QTimer
+    Qt, QModelIndex, QSize, QPoint, QSettings, QStandardPaths,
+    Signal, QTimer, QThreadPool
 )
 from PySide6.QtGui import (
-    QIcon, QAction, QKeySequence, QCloseEvent
+    QAction, QKeySequence, QCloseEvent
 )
 
+import qasync  # Imported after PySide6 so qasync binds to it
+
+from view_mesh.settings_io import flush_settings_writes, queue_file_write, warm_directory
+
+log = logging.getLogger(__name__)
+
+def _config_file(org_name: str, app_name: str) -> Path:
+    """Location of the JSON configuration blob, alongside where QSettings keeps its INI file."""
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericConfigLocation)
+    return Path(base) / org_name / f"{app_name}.json"
+
+# Each file's blob as last read or queued, so unchanged files are not rewritten
+_saved_blobs: Dict[Path, bytes] = {}
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Parse a JSON blob written by _queue_write; None if it is missing, unreadable or not an object."""
+    try:
+        blob = path.read_bytes()
+        data = json.loads(blob)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict): # Hand-edited or foreign file
+        return None
+    _saved_blobs[path] = blob
+    return data
+
+def _queue_write(path: Path, data: Dict[str, Any]) -> None:
+    """Queue the data for writing to path unless that file already holds it."""
+    blob = json.dumps(data).encode("utf-8")
+    if _saved_blobs.get(path) != blob:
+        queue_file_write(path, blob)
+        _saved_blobs[path] = blob
+
 @dataclass
 class WindowSettings:
     """Store window position, size and state."""
@@ -31,39 +67,62 @@ class WindowSettings:
     screen_name: str = ""  # Store screen identifier
     screen_position: Tuple[int, int] = (0, 0)  # Store the screen's position in the virtual desktop
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WindowSettings':
+        """Load window settings from the dict produced by to_dict().
+
+        Values of the wrong type or shape, e.g. from a hand-edited file, keep their defaults.
+        """
+        result = cls()
+        for f in fields(cls):
+            value = data.get(f.name)
+            default = getattr(result, f.name)
+            if f.name == "state":
+                if isinstance(value, str):
+                    try:
+                        result.state = base64.b64decode(value, validate=True)
+                    except ValueError:
+                        pass
+                continue
+            if isinstance(default, tuple): # JSON hands tuples back as lists
+                if not isinstance(value, list) or len(value) != len(default) \
+                        or any(type(v) is not int for v in value):
+                    continue
+                value = tuple(value)
+            elif type(value) is not type(default):
+                continue
+            setattr(result, f.name, value)
+        return result
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain JSON-serializable form of the settings."""
+        data = asdict(self)
+        data["state"] = base64.b64encode(self.state).decode("ascii") if self.state else None
+        return data
+    
     @classmethod
     def from_settings(cls, settings: QSettings) -> 'WindowSettings':
-        """Load window settings from QSettings."""
+        """Load window settings from QSettings (first-run migration only)."""
         result = cls()
-        if settings.contains("window/size"):
+        known = set(settings.allKeys()) # One scan instead of a contains() lookup per key
+        if "window/size" in known:
             size = settings.value("window/size")
             result.size = (size.width(), size.height())
-        if settings.contains("window/position"):
+        if "window/position" in known:
             pos = settings.value("window/position")
             result.position = (pos.x(), pos.y())
-        if settings.contains("window/is_maximized"):
+        if "window/is_maximized" in known:
             result.is_maximized = settings.value("window/is_maximized", False, type=bool)
-        if settings.contains("window/explorer_width"):
+        if "window/explorer_width" in known:
             result.explorer_width = settings.value("window/explorer_width", 250, type=int)
-        if settings.contains("window/state"):
-            result.state = settings.value("window/state")
-        if settings.contains("window/screen_name"):
+        if "window/state" in known:
+            result.state = bytes(settings.value("window/state"))
+        if "window/screen_name" in known:
             result.screen_name = settings.value("window/screen_name", "")
-        if settings.contains("window/screen_position"):
+        if "window/screen_position" in known:
             pos = settings.value("window/screen_position")
             result.screen_position = (pos.x(), pos.y())
         return result
-    
-    def save_to_settings(self, settings: QSettings) -> None:
-        """Save window settings to QSettings."""
-        settings.setValue("window/size", QSize(*self.size))
-        settings.setValue("window/position", QPoint(*self.position))
-        settings.setValue("window/is_maximized", self.is_maximized)
-        settings.setValue("window/explorer_width", self.explorer_width)
-        settings.setValue("window/screen_name", self.screen_name)
-        settings.setValue("window/screen_position", QPoint(*self.screen_position))
-        if self.state:
-            settings.setValue("window/state", self.state)
 
 @dataclass
 class AppConfig:
@@ -72,32 +131,59 @@ class AppConfig:
     org_name: str = "AnchorSCAD"
     settings: WindowSettings = field(default_factory=WindowSettings)
     initial_dir: str = field(default_factory=lambda: str(Path.home()))
+    restore_geometry: bool = True # False: start with default geometry and never store it
     
     @classmethod
     def load(cls) -> 'AppConfig':
-        """Load configuration from settings."""
+        """Load configuration from the JSON files, migrating from QSettings on first run."""
         config = cls()
-        settings = QSettings(config.org_name, config.app_name)
-        config.settings = WindowSettings.from_settings(settings)
-        if settings.contains("app/initial_dir"):
-            config.initial_dir = settings.value("app/initial_dir")
+        app_data = _read_json(config.app_settings_file())
+        if app_data is not None:
+            initial_dir = app_data.get("initial_dir")
+            if isinstance(initial_dir, str): # A hand-edited value of another type keeps the default
+                config.initial_dir = initial_dir
+            if not app_data.get("restore_geometry", True):
+                config.restore_geometry = False
+                return config # The window state is not wanted, so it is not read
+        state_data = _read_json(config.window_state_file())
+        if app_data is None and state_data is None:
+            settings = QSettings(config.org_name, config.app_name)
+            config.restore_geometry = settings.value("app/restore_geometry", True, type=bool)
+            if config.restore_geometry:
+                config.settings = WindowSettings.from_settings(settings)
+            config.initial_dir = settings.value("app/initial_dir", config.initial_dir)
+            return config
+        if state_data is not None:
+            config.settings = WindowSettings.from_dict(state_data)
+        elif isinstance(app_data.get("settings"), dict):
+            # Written when the window state still lived in the app file; the next save splits it out
+            config.settings = WindowSettings.from_dict(app_data["settings"])
         return config
     
+    def app_settings_file(self) -> Path:
+        return _config_file(self.org_name, self.app_name)
+    
+    def window_state_file(self) -> Path:
+        # Window geometry changes far more often than the app settings, so it gets its own
+        # small file: geometry saves never rewrite (or risk corrupting) the settings file
+        return _config_file(self.org_name, f"{self.app_name}-WindowState")
+    
     def save(self) -> None:
-        """Save configuration to settings."""
-        settings = QSettings(self.org_name, self.app_name)
-        self.settings.save_to_settings(settings)
-        settings.setValue("app/initial_dir", self.initial_dir)
+        """Queue the configuration for writing; the disk I/O happens off the GUI thread."""
+        _queue_write(self.app_settings_file(),
+                     {"initial_dir": self.initial_dir, "restore_geometry": self.restore_geometry})
+        if self.restore_geometry:
+            _queue_write(self.window_state_file(), self.settings.to_dict())
 
-@dataclass
 class FileExplorerWidget(QWidget):
     """File explorer widget similar to VSCode."""
-    parent: Optional[QWidget] = None
-    initial_dir: str = field(default_factory=lambda: str(Path.home()))
-    file_selected: Signal = field(default_factory=lambda: Signal(str))
+    file_selected = Signal(str)
+    _shared_model: Optional[QFileSystemModel] = None
+    model: Optional[QFileSystemModel] = None # Attached by _ensure_model when first needed
 
-    def __post_init__(self):
-        super().__init__(self.parent)
+    def __init__(self, parent: Optional[QWidget] = None, initial_dir: Optional[str] = None):
+        super().__init__(parent)
+        self.initial_dir = initial_dir if initial_dir is not None else str(Path.home())
         self.setup_ui()
     
     def setup_ui(self):
@@ -105,55 +191,115 @@ class FileExplorerWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create file system model
-        self.model = QFileSystemModel()
-        self.model.setRootPath(self.initial_dir)
-        
-        # Create tree view
+        # Create tree view; the model is attached when the explorer is first shown
         self.tree_view = QTreeView()
-        self.tree_view.setModel(self.model)
-        self.tree_view.setRootIndex(self.model.index(self.initial_dir))
         self.tree_view.setAnimated(False)
         self.tree_view.setIndentation(20)
         self.tree_view.setSortingEnabled(True)
-        
-        # Only show the file name column initially
         self.tree_view.setHeaderHidden(True)
-        for i in range(1, self.model.columnCount()):
-            self.tree_view.hideColumn(i)
         
         # Connect signals
-        self.tree_view.clicked.connect(self._on_item_clicked)
         self.tree_view.doubleClicked.connect(self._on_item_double_clicked)
         
         layout.addWidget(self.tree_view)
         self.setLayout(layout)
     
-    def _on_item_clicked(self, index: QModelIndex):
-        """Handle item clicked event."""
-        file_path = self.model.filePath(index)
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.model is None:
+            # Start the directory scan after the first paint rather than inside it
+            QTimer.singleShot(0, self, self._ensure_model)
+    
+    def _ensure_model(self) -> QFileSystemModel:
+        """Attach the file system model, so a never-shown explorer never scans or watches anything."""
+        if self.model is None:
+            # One model (and its file watcher) is shared by every explorer; each view is scoped by its root index
+            if FileExplorerWidget._shared_model is None:
+                FileExplorerWidget._shared_model = QFileSystemModel()
+                FileExplorerWidget._shared_model.setRootPath("")
+            self.model = FileExplorerWidget._shared_model
+            self.tree_view.setModel(self.model)
+            self.tree_view.setRootIndex(self.model.index(self.initial_dir))
+            
+            # Only show the file name column initially
+            # One header repaint for the whole batch; signals stay live since the view tracks them
+            header = self.tree_view.header()
+            header.setUpdatesEnabled(False)
+            for i in range(1, self.model.columnCount()):
+                header.setSectionHidden(i, True)
+            header.setUpdatesEnabled(True)
+        return self.model
     
     def _on_item_double_clicked(self, index: QModelIndex):
         """Handle item double clicked event."""
-        file_path = self.model.filePath(index)
-        if os.path.isfile(file_path):
-            self.file_selected.emit(file_path)
+        info = self.model.fileInfo(index)
+        if info.isFile():
+            self.file_selected.emit(info.absoluteFilePath())
     
     def set_root_path(self, path: str):
         """Set the root path for the file explorer."""
-        self.model.setRootPath(path)
-        self.tree_view.setRootIndex(self.model.index(path))
+        # Re-rooting the model rescans and re-registers its watcher, so only do it when the
+        # path lies outside what the model already covers (an empty root covers everything)
+        model = self._ensure_model()
+        root = model.rootPath()
+        if root:
+            try:
+                covered = os.path.commonpath([os.path.abspath(root), os.path.abspath(path)]) == os.path.abspath(root)
+            except ValueError: # Different drives
+                covered = False
+            if not covered:
+                model.setRootPath(path)
+        self.tree_view.setRootIndex(model.index(path))
+
+
+# (ViewMeshApp attribute, menu title, items); each item is (text, shortcut, ViewMeshApp
+# slot name, initial check state or None if not checkable), or None for a separator
+_MENU_SPEC = [
+    ("file_menu", "&File", [
+        ("&New File", QKeySequence.New, "on_new_file", None),
+        ("&Open File...", QKeySequence.Open, "on_open_file", None),
+        ("Open F&older...", None, "on_open_folder", None),
+        None,
+        ("&Save", QKeySequence.Save, "on_save", None),
+        ("Save &As...", QKeySequence.SaveAs, "on_save_as", None),
+        None,
+        ("E&xit", QKeySequence.Quit, "close", None),
+    ]),
+    ("edit_menu", "&Edit", [
+        ("&Undo", QKeySequence.Undo, None, None),
+        ("&Redo", QKeySequence.Redo, None, None),
+        None,
+        ("Cu&t", QKeySequence.Cut, None, None),
+        ("&Copy", QKeySequence.Copy, None, None),
+        ("&Paste", QKeySequence.Paste, None, None),
+    ]),
+    ("view_menu", "&View", [
+        ("&Explorer", None, "toggle_explorer", True),
+    ]),
+    ("help_menu", "&Help", [
+        ("&About", None, "on_about", None),
+    ]),
+]
 
 
 class ViewMeshApp(QMainWindow):
     """Main ViewMesh application window."""
+    GEOMETRY_SAVE_DELAY_MS = 500 # Quiet period after the last move/resize before saving
     
     def __init__(self, config: AppConfig):
         super().__init__()
         self.config = config
+        # Warm the explorer's directory listing while the UI is built
+        QThreadPool.globalInstance().start(lambda: warm_directory(config.initial_dir))
         self.setWindowTitle(config.app_name)
         
-        # Set up async event loop integration
+        # Coalesces the stream of move/resize events from a drag into a single save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.GEOMETRY_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_window_state)
+        
+        # Set up the asyncio loop; main() runs it in place of app.exec()
         self.setup_async_loop()
         
         # Set up UI
@@ -192,7 +338,7 @@ class ViewMeshApp(QMainWindow):
         # Add a placeholder tab for now
         placeholder = QWidget()
         placeholder_layout = QVBoxLayout(placeholder)
-        placeholder_layout.addWidget(QWidget())
+        placeholder_layout.addStretch(1)
         self.tab_widget.addTab(placeholder, "Welcome")
         
         # Main content
@@ -219,96 +365,32 @@ class ViewMeshApp(QMainWindow):
     def setup_menu_bar(self):
         """Set up the menu bar similar to VSCode."""
         self.menu_bar = self.menuBar()
-        
-        # File menu
-        self.file_menu = self.menu_bar.addMenu("&File")
-        
-        # New file action
-        new_file_action = QAction("&New File", self)
-        new_file_action.setShortcut(QKeySequence.New)
-        new_file_action.triggered.connect(self.on_new_file)
-        self.file_menu.addAction(new_file_action)
-        
-        # Open file action
-        open_file_action = QAction("&Open File...", self)
-        open_file_action.setShortcut(QKeySequence.Open)
-        open_file_action.triggered.connect(self.on_open_file)
-        self.file_menu.addAction(open_file_action)
-        
-        # Open folder action
-        open_folder_action = QAction("Open F&older...", self)
-        open_folder_action.triggered.connect(self.on_open_folder)
-        self.file_menu.addAction(open_folder_action)
-        
-        self.file_menu.addSeparator()
-        
-        # Save action
-        save_action = QAction("&Save", self)
-        save_action.setShortcut(QKeySequence.Save)
-        save_action.triggered.connect(self.on_save)
-        self.file_menu.addAction(save_action)
-        
-        # Save as action
-        save_as_action = QAction("Save &As...", self)
-        save_as_action.setShortcut(QKeySequence.SaveAs)
-        save_as_action.triggered.connect(self.on_save_as)
-        self.file_menu.addAction(save_as_action)
-        
-        self.file_menu.addSeparator()
-        
-        # Exit action
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.Quit)
-        exit_action.triggered.connect(self.close)
-        self.file_menu.addAction(exit_action)
-        
-        # Edit menu
-        self.edit_menu = self.menu_bar.addMenu("&Edit")
-        
-        # Undo action
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut(QKeySequence.Undo)
-        self.edit_menu.addAction(undo_action)
-        
-        # Redo action
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut(QKeySequence.Redo)
-        self.edit_menu.addAction(redo_action)
-        
-        self.edit_menu.addSeparator()
-        
-        # Cut action
-        cut_action = QAction("Cu&t", self)
-        cut_action.setShortcut(QKeySequence.Cut)
-        self.edit_menu.addAction(cut_action)
-        
-        # Copy action
-        copy_action = QAction("&Copy", self)
-        copy_action.setShortcut(QKeySequence.Copy)
-        self.edit_menu.addAction(copy_action)
-        
-        # Paste action
-        paste_action = QAction("&Paste", self)
-        paste_action.setShortcut(QKeySequence.Paste)
-        self.edit_menu.addAction(paste_action)
-        
-        # View menu
-        self.view_menu = self.menu_bar.addMenu("&View")
-        
-        # Toggle explorer action
-        toggle_explorer_action = QAction("&Explorer", self)
-        toggle_explorer_action.setCheckable(True)
-        toggle_explorer_action.setChecked(True)
-        toggle_explorer_action.triggered.connect(self.toggle_explorer)
-        self.view_menu.addAction(toggle_explorer_action)
-        
-        # Help menu
-        self.help_menu = self.menu_bar.addMenu("&Help")
-        
-        # About action
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.on_about)
-        self.help_menu.addAction(about_action)
+        for attr, title, items in _MENU_SPEC:
+            menu = self.menu_bar.addMenu(title)
+            setattr(self, attr, menu)
+            if any(spec is not None and spec[1] is not None for spec in items):
+                self._populate_menu(menu, items) # Shortcuts must work before the menu is opened
+            else:
+                # Nothing to trigger without opening the menu, so build it on first open
+                menu.aboutToShow.connect(
+                    functools.partial(self._populate_menu, menu, items), Qt.SingleShotConnection)
+    
+    def _populate_menu(self, menu: QMenu, items: list):
+        """Add the actions of a _MENU_SPEC item list to the menu."""
+        for spec in items:
+            if spec is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, slot, checked = spec
+            action = QAction(text, self)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            if checked is not None:
+                action.setCheckable(True)
+                action.setChecked(checked)
+            if slot is not None:
+                action.triggered.connect(getattr(self, slot))
+            menu.addAction(action)
     
     def setup_tool_bar(self):
         """Set up the tool bar."""
@@ -327,56 +409,30 @@ class ViewMeshApp(QMainWindow):
         self.tool_bar.addAction(save_action)
     
     def setup_async_loop(self):
-        """Set up the asyncio event loop and integrate with PySide6."""
-        self.loop = asyncio.new_event_loop()
+        """Set up the asyncio event loop, driven by Qt's own event dispatcher via qasync."""
+        self.loop = qasync.QEventLoop(QApplication.instance())
         asyncio.set_event_loop(self.loop)
-        
-        # Create a timer to run the asyncio event loop
-        self.async_timer = QTimer(self)
-        self.async_timer.timeout.connect(self._process_asyncio_events)
-        self.async_timer.start(10)  # 10ms interval
-    
-    def _process_asyncio_events(self):
-        """Process pending asyncio events."""
-        self.loop.call_soon(self._run_event_loop_iteration)
-    
-    def _run_event_loop_iteration(self):
-        """Run a single iteration of the asyncio event loop."""
-        try:
-            self.loop.stop()
-            self.loop.run_forever()
-        except Exception as e:
-            print(f"Error in asyncio event loop: {e}")
     
     async def run_async_task(self, coro):
         """Run an asynchronous task."""
         try:
             return await coro
         except Exception as e:
-            print(f"Error in async task: {e}")
+            log.error("Error in async task: %s", e)
             return None
     
     def schedule_async_task(self, coro):
         """Schedule an asynchronous task to be run in the asyncio loop."""
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        return future
+        return self.loop.create_task(coro) # Always called on the GUI thread, which runs the loop
     
     def restore_window_state(self):
         """Restore the window state from the configuration."""
-        # Get available screens
-        screens = QApplication.screens()
-        target_screen = None
+        if not self.config.restore_geometry:
+            return # Opted out: leave placement and dock layout to Qt's defaults
         
-        # Try to find the saved screen by name
-        if self.config.settings.screen_name:
-            for screen in screens:
-                if screen.name() == self.config.settings.screen_name:
-                    target_screen = screen
-                    break
-        
-        # If the saved screen wasn't found, use the primary screen
-        if not target_screen:
-            target_screen = QApplication.primaryScreen()
+        # Find the saved screen by name, falling back to the primary screen
+        screens_by_name = {screen.name(): screen for screen in QApplication.screens()}
+        target_screen = screens_by_name.get(self.config.settings.screen_name) or QApplication.primaryScreen()
         
         # Get the target screen geometry
         screen_geo = target_screen.geometry()
@@ -430,6 +486,15 @@ class ViewMeshApp(QMainWindow):
     
     def save_window_state(self):
         """Save the current window state to the configuration."""
+        if self.config.restore_geometry:
+            self._store_geometry()
+        self.config.initial_dir = self.explorer.initial_dir
+        
+        # Save configuration
+        self.config.save()
+    
+    def _store_geometry(self):
+        """Copy the window's screen, geometry and dock layout into the configuration."""
         # Get current screen
         current_screen = self.screen()
         if current_screen:
@@ -445,19 +510,23 @@ class ViewMeshApp(QMainWindow):
         
         self.config.settings.is_maximized = self.isMaximized()
         self.config.settings.explorer_width = self.explorer_dock.width()
-        self.config.settings.state = self.saveState()
-        self.config.initial_dir = self.explorer.initial_dir
-        
-        # Save configuration
-        self.config.save()
+        self.config.settings.state = bytes(self.saveState())
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._save_timer.start() # Restart the countdown
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self._save_timer.start()
     
     def closeEvent(self, event: QCloseEvent):
         """Handle window close event."""
-        # Save window state
-        self.save_window_state()
+        self._save_timer.stop() # Superseded by the save below
         
-        # Clean up asyncio loop
-        self.async_timer.stop()
+        # Save window state and wait for the writer thread to reach the disk
+        self.save_window_state()
+        flush_settings_writes()
         
         # Accept the close event
         event.accept()
@@ -533,6 +602,7 @@ def parse_args():
 
 def main():
     """Main entry point for the application."""
+    logging.basicConfig(level=logging.WARNING)
     # Parse command line arguments
     args = parse_args()
     
@@ -551,8 +621,11 @@ def main():
     window = ViewMeshApp(config)
     window.show()
     
-    # Run the Qt event loop
-    sys.exit(app.exec())
+    # Run the Qt event loop through qasync so coroutines see a running asyncio loop;
+    # run_forever() returns app.exec()'s exit code
+    with window.loop:
+        exit_code = window.loop.run_forever()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file